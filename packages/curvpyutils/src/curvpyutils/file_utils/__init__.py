@@ -1,12 +1,13 @@
 """File system utilities."""
 
-from .fs_utils import find_path_by_leaf
+from .fs_utils import find_path_by_leaf, is_readable_file
 from .hex_file_utils import read_hex_file, read_hex_file_as_ints
 from .repo_utils import get_git_repo_root, is_path_writeable, make_repo_root_relpath_into_abs
 from .dir_walker import DirWalker
-from .open_write_iff_change import open_write_iff_change
+from .open_write_iff_change import open_write_iff_change, write_iff_change
 __all__ = [
     "find_path_by_leaf",
+    "is_readable_file",
     "read_hex_file",
     "read_hex_file_as_ints",
     "get_git_repo_root",
@@ -14,5 +15,6 @@ __all__ = [
     "make_repo_root_relpath_into_abs",
     "DirWalker",
     "open_write_iff_change",
+    "write_iff_change",
 ]
 
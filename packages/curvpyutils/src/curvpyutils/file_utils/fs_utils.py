@@ -1,4 +1,5 @@
 import os
+import stat
 
 
 def find_path_by_leaf(root_dir: str, leaf_path: str) -> str | None:
@@ -31,3 +32,22 @@ def find_path_by_leaf(root_dir: str, leaf_path: str) -> str | None:
 
     return None
 
+
+def is_readable_file(path: str | os.PathLike) -> bool:
+    """Return ``True`` if ``path`` is an existing, readable regular file.
+
+    Uses a single ``os.stat`` for the existence and file-type check instead of
+    separate ``isfile``/``exists`` probes.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        ``True`` if ``path`` is a regular file we can read, ``False`` otherwise.
+    """
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and os.access(path, os.R_OK)
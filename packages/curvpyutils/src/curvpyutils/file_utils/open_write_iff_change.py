@@ -2,7 +2,7 @@ import os
 import filecmp
 from pathlib import Path
 from types import TracebackType
-from typing import Optional, IO, ContextManager
+from typing import Optional, IO, ContextManager, Iterable
 
 """
 Context manager that opens a file for writing and overwrites if and only if the new contents 
@@ -112,4 +112,48 @@ def open_write_iff_change(path: str | Path, mode: str, force_overwrite: bool = F
         path, 
         mode, 
         force_overwrite=force_overwrite,
-    )
\ No newline at end of file
+    )
+
+
+def write_iff_change(path: str | Path, content: str | bytes | Iterable[str | bytes], force_overwrite: bool = False) -> bool:
+    """
+    Write `content` to `path` if and only if it differs from the existing contents.
+
+    Unlike open_write_iff_change, the unchanged case costs a single read of the existing
+    file (skipped entirely when the sizes differ) instead of writing, fsyncing and comparing
+    a temp file.
+
+    Args:
+        path: path to the file to possibly overwrite
+        content: the new contents, or an iterable of str/bytes parts, which are joined into
+            a single buffer before comparing and writing (str is encoded as UTF-8); parts are
+            a convenience for callers that build a file line by line, not a streaming API
+        force_overwrite: Whether to force overwrite the file regardless of whether the new contents are the same as the existing contents.
+
+    Returns:
+        True if the file was (over)written, False if it was left untouched.
+    """
+    # emitters pass many short lines; encoding, comparing and writing them as one
+    # buffer beats doing each per chunk
+    if isinstance(content, str):
+        data = content.encode("utf-8")
+    elif isinstance(content, bytes):
+        data = content
+    else:
+        chunks = list(content)
+        if all(isinstance(c, str) for c in chunks):
+            data = "".join(chunks).encode("utf-8")
+        else:
+            data = b"".join(c.encode("utf-8") if isinstance(c, str) else c for c in chunks)
+    if not force_overwrite:
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            size = None
+        if size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    with OpenOverwriteIffChange(path, "wb", force_overwrite=True) as f:
+        f.write(data)
+    return True
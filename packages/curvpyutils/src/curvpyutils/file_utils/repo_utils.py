@@ -4,9 +4,19 @@ from pathlib import Path
 from typing import Optional
 
 
+# directory -> git repo root; only successful lookups are cached, so a directory that
+# later becomes part of a repo is still picked up
+_git_repo_root_cache: dict[str, str] = {}
+
+
 def get_git_repo_root(cwd: Optional[str] = None) -> Optional[str]:
     """Return the absolute path to the git repository root for ``cwd``."""
 
+    key = os.path.abspath(cwd) if cwd is not None else os.getcwd()
+    cached = _git_repo_root_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -18,7 +28,10 @@ def get_git_repo_root(cwd: Optional[str] = None) -> Optional[str]:
     except subprocess.CalledProcessError:
         return None
 
-    return result.stdout.strip() if result.stdout else None
+    repo_root = result.stdout.strip() if result.stdout else None
+    if repo_root:
+        _git_repo_root_cache[key] = repo_root
+    return repo_root
 
 
 def is_path_writeable(path: str | Path) -> bool:
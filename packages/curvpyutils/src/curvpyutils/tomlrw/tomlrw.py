@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Protocol, runtime_checkable
+from typing import Any, Callable, Dict, Protocol, runtime_checkable
 import sys
 from pathlib import Path
 from typing import BinaryIO
@@ -10,6 +10,10 @@ from ._canonicalizer import canonicalize_toml_str
 # Initialized on first use.
 _TOML_BACKEND: "TomlBackend | None" = None
 
+# Global variable storing the TOML parse function. Reading never needs a writer, so this
+# is chosen (and imported) separately from _TOML_BACKEND. Initialized on first use.
+_TOML_LOADS: "Callable[[str], Dict[str, Any]] | None" = None
+
 
 @runtime_checkable
 class TomlBackend(Protocol):
@@ -114,12 +118,37 @@ def _ensure_backend() -> TomlBackend:
     return _TOML_BACKEND
 
 
+def _ensure_loads() -> Callable[[str], Dict[str, Any]]:
+    """
+    Return the TOML parse function.
+
+    Preference order:
+      1. stdlib tomllib
+      2. tomli
+      3. whatever _ensure_backend() finds
+
+    Unlike the read/write backend, this does not require (or import) tomli_w, so
+    read-only callers still get tomllib when no writer is installed.
+    """
+    global _TOML_LOADS
+    if _TOML_LOADS is None:
+        try:
+            import tomllib  # type: ignore[import]
+            _TOML_LOADS = tomllib.loads
+        except ImportError:
+            try:
+                import tomli  # type: ignore[import]
+                _TOML_LOADS = tomli.loads
+            except ImportError:
+                _TOML_LOADS = _ensure_backend().loads
+    return _TOML_LOADS
+
+
 def _load_toml_bytes(b: bytes) -> Dict[str, Any]:
     """
     Parse TOML from raw bytes into a dict.
     """
-    backend = _ensure_backend()
-    return backend.loads(b.decode("utf-8"))
+    return _ensure_loads()(b.decode("utf-8"))
 
 ################################################################################
 #
@@ -190,8 +219,7 @@ def loads(s: str) -> Dict[str, Any]:
     Returns: 
         A dictionary that can be used to read the TOML string.
     """
-    backend = _ensure_backend()
-    return backend.loads(s)
+    return _ensure_loads()(s)
 
 __all__ = [
     "dumps",
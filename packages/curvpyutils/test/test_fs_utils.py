@@ -0,0 +1,33 @@
+"""Unit tests for curvpyutils.file_utils.fs_utils."""
+
+import os
+
+import pytest
+
+from curvpyutils.file_utils import is_readable_file
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestIsReadableFile:
+    def test_regular_file(self, tmp_path):
+        p = tmp_path / "a.toml"
+        p.write_text("x = 1\n")
+        assert is_readable_file(p)
+        assert is_readable_file(str(p))
+
+    def test_missing_file(self, tmp_path):
+        assert not is_readable_file(tmp_path / "missing.toml")
+
+    def test_directory(self, tmp_path):
+        assert not is_readable_file(tmp_path)
+
+    @pytest.mark.skipif(os.geteuid() == 0, reason="root can read files regardless of mode bits")
+    def test_unreadable_file(self, tmp_path):
+        p = tmp_path / "b.toml"
+        p.write_text("x = 1\n")
+        p.chmod(0)
+        try:
+            assert not is_readable_file(p)
+        finally:
+            p.chmod(0o644)
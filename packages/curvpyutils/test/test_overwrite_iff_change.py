@@ -4,7 +4,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from curvpyutils.file_utils import open_write_iff_change
+from curvpyutils.file_utils import open_write_iff_change, write_iff_change
 
 pytestmark = [pytest.mark.unit]
 
@@ -47,4 +47,30 @@ def test_open_write_iff_change_no_overwrite_when_identical():
 
         assert p.read_text() == "Hello, world!"
         assert after_mtime == before_mtime  # unchanged
-        assert cm.changed is False
\ No newline at end of file
+        assert cm.changed is False
+
+def test_write_iff_change(tmp_path):
+    p = tmp_path / "sub" / "test.txt"
+    assert write_iff_change(p, "Hello, world!") is True
+    p.chmod(0o640)
+    before_mtime_ns = p.stat().st_mtime_ns
+
+    # identical contents leave the file alone
+    assert write_iff_change(p, "Hello, world!") is False
+    assert p.stat().st_mtime_ns == before_mtime_ns
+
+    # same size, different contents
+    assert write_iff_change(p, "Hello, World!") is True
+    assert p.read_text() == "Hello, World!"
+    assert p.stat().st_mode & 0o777 == 0o640
+
+    assert write_iff_change(p, b"Hello, World!", force_overwrite=True) is True
+    assert not list(p.parent.glob(".tmp_*"))
+
+
+def test_write_iff_change_chunks(tmp_path):
+    p = tmp_path / "test.txt"
+    p.write_text("Hello, world!", encoding="utf-8")
+    assert write_iff_change(p, ["Hello", b", ", "world!"]) is False
+    assert write_iff_change(p, ["Hello", ", ", "World!"]) is True
+    assert p.read_text() == "Hello, World!"
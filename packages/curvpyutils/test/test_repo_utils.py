@@ -0,0 +1,30 @@
+"""Unit tests for curvpyutils.file_utils.repo_utils."""
+
+import subprocess
+
+import pytest
+
+from curvpyutils.file_utils import repo_utils
+from curvpyutils.file_utils.repo_utils import get_git_repo_root
+
+pytestmark = [pytest.mark.unit]
+
+
+class TestGetGitRepoRoot:
+    def test_caches_successful_lookup(self, tmp_path, monkeypatch):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        monkeypatch.setattr(repo_utils, "_git_repo_root_cache", {})
+        root = get_git_repo_root(cwd=str(tmp_path))
+        assert root is not None
+
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be run again")
+
+        monkeypatch.setattr(repo_utils.subprocess, "run", fail)
+        assert get_git_repo_root(cwd=str(tmp_path)) == root
+
+    def test_does_not_cache_failed_lookup(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(repo_utils, "_git_repo_root_cache", {})
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        assert get_git_repo_root(cwd=str(tmp_path)) is None
+        assert repo_utils._git_repo_root_cache == {}
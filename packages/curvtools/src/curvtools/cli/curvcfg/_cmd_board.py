@@ -0,0 +1,155 @@
+from __future__ import annotations
+import click
+from typing import Any
+from curvtools.cli.curvcfg.cli_helpers.help_formatter import (
+    CurvcfgHelpFormatterGroup,
+    CurvcfgHelpFormatterCommand,
+)
+from curvtools.cli.curvcfg.cli_helpers.opts import FsPathType
+from curvtools.cli.curvcfg.cli_helpers.paramtypes import (
+    DeviceResolvable,
+    BoardResolvable,
+    device_type,
+    board_type,
+    input_merged_board_toml_type,
+    output_merged_board_toml_type,
+    schema_file_type,
+)
+from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
+from curvtools.cli.curvcfg._cmd_common import CONTEXT_SETTINGS, bucket_templates_by_suffix
+
+##########################
+# board subcommand group #
+##########################
+
+@click.group(
+    name="board",
+    cls=CurvcfgHelpFormatterGroup, 
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.pass_context
+def board(ctx: click.Context):
+    """Board artifacts generation"""
+    pass
+
+################################
+# board merge subcommand       #
+################################
+
+@board.command(
+    name="merge",
+    cls=CurvcfgHelpFormatterCommand,
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.option(
+    "--board",
+    "board_name",
+    type=board_type,
+    required=True,
+    help="Board name or path to board directory or path to board TOML file",
+    expose_value=True,
+)
+@click.option(
+    "--device",
+    "device_name",
+    type=device_type,
+    required=True,
+    help="Device name or path to device TOML file",
+    expose_value=True,
+)
+@click.option(
+    "--schema",
+    "schemas",
+    type=schema_file_type,
+    multiple=True,
+    required=True,
+    help="Schema TOML file(s); may be given multiple times; order matters.",
+)
+@click.option(
+    "--merged-board-toml",
+    "merged_board_toml",
+    type=output_merged_board_toml_type,
+    required=True,
+    help="Path to merged board config TOML output file",
+)
+@click.option(
+    "--board-mk-dep",
+    "board_mk_dep",
+    type=click.Path(exists=False, dir_okay=False, resolve_path=True),
+    required=True,
+    help="Path to Makefile dependency file output file for merged board configuration",
+)
+@click.pass_obj
+def merge_board(curvctx: CurvContext, board_name: BoardResolvable, device_name: DeviceResolvable, schemas: list[FsPathType], merged_board_toml: OutputMergedBoardTomlResolvable, board_mk_dep: click.Path):
+    """
+    Merge schemas, board.toml, and <device-name>.toml for hardware configuration and write merged_board.toml + board.mk.d
+    """
+    merged_board_toml_out_path = merged_board_toml.resolve(curvctx.curvpaths).path
+    curvctx.board = board_name.resolve(curvctx.curvpaths).name
+    curvctx.device = device_name.resolve(curvctx.curvpaths).name
+    curv_paths = curvctx.make_paths()
+
+    from curvtools.cli.curvcfg.board import merge_board_impl
+    merge_board_impl(curvctx, board_name, device_name, schemas, merged_board_toml_out_path, board_mk_dep)
+
+
+
+############################$$
+# board generate subcommand  #
+############################$$
+
+@board.command(
+    name="generate",
+    cls=CurvcfgHelpFormatterCommand,
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.option(
+    "--merged-board-toml",
+    "merged_board_toml",
+    type=input_merged_board_toml_type,
+    required=True,
+    help="Path to merged board config TOML input file",
+)
+@click.option(
+    "--template",
+    "templates",
+    type=click.Path(file_okay=True, dir_okay=False, resolve_path=True, exists=True),
+    multiple=True,
+    required=False,
+    help="Optional template override(s); may be given multiple times (.sv.jinja2, .svh.jinja2, .env.jinja2, .mk.jinja2).",
+)
+@click.pass_obj
+def generate_board(curvctx: CurvContext, merged_board_toml: InputMergedBoardTomlResolvable, templates: tuple[str, ...]):
+    """
+    Generate board configuration artifacts from <merged_board_toml>
+    """
+    merged_board_toml_path = merged_board_toml.resolve(curvctx.curvpaths).path
+    verbosity = curvctx.verbosity
+    templates_by_suffix = bucket_templates_by_suffix(templates)
+    curv_paths = curvctx.make_paths()
+
+    if verbosity >= 2:
+        show_args: dict[str, Any] = {
+            "curv_root_dir": curv_paths.curv_root_dir,
+            "build_dir": curvctx.build_dir,
+            "merged_board_toml": merged_board_toml_path,
+            "svpkg_template": templates_by_suffix["svpkg_template"],
+            "svh_template": templates_by_suffix["svh_template"],
+            "mk_template": templates_by_suffix["mk_template"],
+            "env_template": templates_by_suffix["env_template"],
+            "verbosity": verbosity,
+        }
+        from curvtools.cli.curvcfg.lib.util.draw_tables import display_tool_settings, display_args_table, flush_tables
+        display_tool_settings(curvctx)
+        display_args_table(show_args, "board generate")
+        flush_tables()
+
+    from curvtools.cli.curvcfg.generate import generate_board_artifacts_impl
+    generate_board_artifacts_impl(
+        curvctx,
+        merged_board_toml_path,
+        svpkg_template=templates_by_suffix["svpkg_template"],
+        svh_template=templates_by_suffix["svh_template"],
+        mk_template=templates_by_suffix["mk_template"],
+        env_template=templates_by_suffix["env_template"],
+    )
@@ -0,0 +1,155 @@
+from __future__ import annotations
+import click
+from typing import Any
+from curvtools.cli.curvcfg.cli_helpers.help_formatter import (
+    CurvcfgHelpFormatterGroup,
+    CurvcfgHelpFormatterCommand,
+)
+from curvtools.cli.curvcfg.cli_helpers.opts import FsPathType
+from curvtools.cli.curvcfg.cli_helpers.paramtypes import (
+    ProfileResolvable,
+    profile_type,
+    input_merged_config_toml_type,
+    output_merged_config_toml_type,
+    schema_file_type,
+)
+from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
+from curvtools.cli.curvcfg._cmd_common import CONTEXT_SETTINGS, bucket_templates_by_suffix
+
+##########################
+# cfgvars subcommand group #
+##########################
+
+@click.group(
+    name="cfgvars",
+    cls=CurvcfgHelpFormatterGroup, 
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.pass_obj
+def cfgvars(curvctx: CurvContext):
+    """Configuration variables merging and artifact generation"""
+    # nothing else; we’ll call curvctx.make_paths() in subcommands
+    pass
+
+##############################
+# cfgvars merge subcommand   #
+##############################
+
+@cfgvars.command(
+    name="merge",
+    cls=CurvcfgHelpFormatterCommand,
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.option(
+    "--tb",
+    "is_tb",
+    is_flag=True,
+    default=False,
+    hidden=True,
+    help="Treat configuration variables as testbench-oriented; defaults to deployment context.",
+)
+@click.option(
+    "--profile",
+    type=profile_type,  # or just str and resolve later
+    required=True,
+    help="Profile name or path to TOML profile.",
+)
+@click.option(
+    "--schema",
+    "schemas",
+    type=schema_file_type,
+    multiple=True,
+    required=True,
+    help="Schema TOML file(s); may be given multiple times; order matters.",
+)
+@click.option(
+    "--overlay",
+    "overlays",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    multiple=True,
+    help="Overlay TOML file(s); may be given multiple times; later overrides earlier.",
+)
+@click.option(
+    "--merged-config-toml",
+    "merged_config_toml",
+    type=output_merged_config_toml_type,
+    required=True,
+    help="Path to merged config intermediate TOML output file",
+)
+@click.option(
+    "--config-mk-dep",
+    "config_mk_dep",
+    type=click.Path(exists=False, dir_okay=False, resolve_path=True),
+    required=True,
+    help="Path to Makefile dependency file output file for merged config configuration",
+)
+@click.pass_obj
+def merge_cfgvars(curvctx: CurvContext, is_tb: bool, profile: ProfileResolvable, schemas: list[FsPathType], overlays: list[click.Path], merged_config_toml: OutputMergedConfigTomlResolvable, config_mk_dep: click.Path):
+    """
+    Merge schemas/overlays for configuration variables and write merged_config.toml + config.mk.d
+    """
+    merged_config_toml_out_path = merged_config_toml.resolve(curvctx.curvpaths).path
+    curvctx.profile = profile.resolve(curvctx.curvpaths).name
+    curv_paths = curvctx.make_paths()
+    from curvtools.cli.curvcfg.merge import merged_cfgvars_impl
+    merged_cfgvars_impl(curvctx, profile, schemas, overlays, merged_config_toml_out_path, config_mk_dep, is_tb=is_tb)
+
+###############################
+# cfgvars generate subcommand #
+###############################
+
+@cfgvars.command(
+    name="generate",
+    cls=CurvcfgHelpFormatterCommand,
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.option(
+    "--merged-config-toml",
+    "merged_config_toml",
+    type=input_merged_config_toml_type,
+    required=True,
+    help="Path to merged config TOML input file",
+)
+@click.option(
+    "--template",
+    "templates",
+    type=click.Path(file_okay=True, dir_okay=False, resolve_path=True, exists=True),
+    multiple=True,
+    required=False,
+    help="Optional template override(s); may be given multiple times (.sv.jinja2, .svh.jinja2, .env.jinja2, .mk.jinja2).",
+)
+@click.pass_obj
+def generate_cfgvars(curvctx: CurvContext, merged_config_toml: InputMergedConfigTomlResolvable, templates: tuple[str, ...]):
+    """
+    Generate configuration variable artifacts from merged_config.toml
+    """
+    merged_config_toml_path = merged_config_toml.resolve(curvctx.curvpaths).path
+    verbosity = curvctx.verbosity
+    templates_by_suffix = bucket_templates_by_suffix(templates)
+    curv_paths = curvctx.make_paths()
+
+    if verbosity >= 2:
+        show_args: dict[str, Any] = {
+            "curv_root_dir": curv_paths.curv_root_dir,
+            "build_dir": curvctx.build_dir,
+            "merged_config_toml": merged_config_toml_path,
+            "svpkg_template": templates_by_suffix["svpkg_template"],
+            "svh_template": templates_by_suffix["svh_template"],
+            "mk_template": templates_by_suffix["mk_template"],
+            "env_template": templates_by_suffix["env_template"],
+            "verbosity": verbosity,
+        }
+        from curvtools.cli.curvcfg.lib.util.draw_tables import display_tool_settings, display_args_table, flush_tables
+        display_tool_settings(curvctx)
+        display_args_table(show_args, "cfgvars generate")
+        flush_tables()
+
+    from curvtools.cli.curvcfg.generate import generate_config_artifacts_impl
+    generate_config_artifacts_impl(
+        curvctx,
+        merged_config_toml_path,
+        svpkg_template=templates_by_suffix["svpkg_template"],
+        svh_template=templates_by_suffix["svh_template"],
+        mk_template=templates_by_suffix["mk_template"],
+        env_template=templates_by_suffix["env_template"],
+    )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+import click
+from pathlib import Path
+from typing import Optional
+
+# Shared by the curvcfg root group (cli.py) and the lazily imported _cmd_* subcommand modules.
+
+CONTEXT_SETTINGS = {
+    "help_option_names": ["-h", "--help"],
+}
+
+_TEMPLATE_SUFFIX_TO_KEY = {
+    ".sv.jinja2": "svpkg_template",
+    ".svh.jinja2": "svh_template",
+    ".mk.jinja2": "mk_template",
+    ".env.jinja2": "env_template",
+}
+
+
+def bucket_templates_by_suffix(
+    templates: tuple[str, ...],
+    option_name: str = "--template",
+) -> dict[str, Optional[Path]]:
+    """
+    Ensure each template ends with an allowed suffix and bucket by type.
+    """
+    buckets: dict[str, Optional[Path]] = {
+        value: None for value in _TEMPLATE_SUFFIX_TO_KEY.values()
+    }
+
+    for template in templates:
+        template_path = Path(template)
+        matched_suffix = next(
+            (suffix for suffix in _TEMPLATE_SUFFIX_TO_KEY if template_path.name.endswith(suffix)),
+            None,
+        )
+        if matched_suffix is None:
+            allowed_suffixes = ", ".join(sorted(_TEMPLATE_SUFFIX_TO_KEY.keys()))
+            raise click.BadParameter(
+                f"Template '{template_path}' must end with one of: {allowed_suffixes}",
+                param_hint=option_name,
+            )
+
+        key = _TEMPLATE_SUFFIX_TO_KEY[matched_suffix]
+        if buckets[key] is not None:
+            raise click.BadParameter(
+                f"Multiple templates supplied for '*{matched_suffix}'",
+                param_hint=option_name,
+            )
+        buckets[key] = template_path
+
+    return buckets
@@ -0,0 +1,191 @@
+from __future__ import annotations
+import click
+from typing import Any
+from curvtools.cli.curvcfg.cli_helpers.help_formatter import (
+    CurvcfgHelpFormatterGroup,
+    CurvcfgHelpFormatterCommand,
+)
+from curvtools.cli.curvcfg.cli_helpers.paramtypes import (
+    InputMergedTomlResolvable,
+    profile_type,
+    device_type,
+    board_type,
+    input_merged_toml_type,
+)
+from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
+from curvtools.cli.curvcfg._cmd_common import CONTEXT_SETTINGS
+
+#########################
+# show subcommand group #
+#########################
+
+@click.group(
+    name="show",
+    cls=CurvcfgHelpFormatterGroup, 
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.pass_context
+def show(ctx: click.Context):
+    """Show information"""
+    pass
+
+########################
+# show vars subcommand #
+########################
+
+@show.command(
+    name="vars", 
+    cls=CurvcfgHelpFormatterCommand, 
+    context_settings=CONTEXT_SETTINGS,
+    short_help="Show active configuration variables",
+    help=f"Show active configuration variables from a <merged_toml> file in the build directory")
+@click.option(
+    "--merged-toml",
+    "merged_toml",
+    type=input_merged_toml_type,
+    required=True,
+    help="Path to merged config TOML input file",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    default=False,
+    help="Keep a parsed copy of the merged TOML in <merged_toml>.cache.json next to it and reuse it while the TOML is unchanged",
+)
+@click.pass_obj
+def show_active_variables(
+    curvctx: CurvContext,
+    merged_toml: InputMergedTomlResolvable,
+    use_cache: bool,
+) -> None:
+    merged_toml_in_path = merged_toml.resolve(curvctx.curvpaths).path
+    curv_paths = curvctx.make_paths()
+    verbosity = curvctx.verbosity
+
+    if verbosity >= 2:
+        show_args: dict[str, Any] = {
+            "curv_root_dir": curv_paths.curv_root_dir,
+            "build_dir": curvctx.build_dir,
+            "merged_toml": merged_toml_in_path,
+            "verbosity": verbosity,
+        }
+        from curvtools.cli.curvcfg.lib.util.draw_tables import display_tool_settings, display_args_table, flush_tables
+        display_tool_settings(curvctx)
+        display_args_table(show_args, "show")
+        flush_tables()
+    
+    from curvtools.cli.curvcfg.show import show_active_variables_impl
+    rc = show_active_variables_impl(merged_toml_in_path, curv_paths, verbosity, use_cache=use_cache)
+    raise SystemExit(rc)
+
+############################
+# show profiles subcommand #
+############################
+
+@show.command(
+    name="profiles", 
+    cls=CurvcfgHelpFormatterCommand, 
+    context_settings=CONTEXT_SETTINGS,
+    short_help="Show available profiles",
+)
+@click.pass_obj
+def show_profiles(curvctx: CurvContext) -> None:
+    """Show available profiles (base configurations)"""
+
+    # curvctx = ctx.find_object(CurvContext)
+
+    curv_paths = curvctx.make_paths()
+
+    if curvctx.verbosity >= 2:
+        board_toml = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"]
+        board_name = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"].to_path().parent.name
+        device_toml = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"]
+        device_name = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"].to_path().stem
+        show_args: dict[str, Any] = {
+            "curv_root_dir": curvctx.curv_root_dir,
+            "build_dir": curvctx.build_dir,
+            "board_toml": board_toml if board_toml.is_fully_resolved() and board_toml.to_path().exists() else None,
+            "board_name": board_name if board_name != "$(BOARD)" else None,
+            "device_toml": device_toml if device_toml.is_fully_resolved() and device_toml.to_path().exists() else None,
+            "device_name": device_name if device_name != "$(DEVICE)" else None,
+            "verbosity": curvctx.verbosity,
+        }
+        from curvtools.cli.curvcfg.lib.util.draw_tables import display_args_table, flush_tables
+        display_args_table(show_args, "show")
+        flush_tables()
+
+    from curvtools.cli.curvcfg.show import show_profiles_impl
+    rc = show_profiles_impl(curv_paths)
+    raise SystemExit(rc)
+
+#############################
+# show curvpaths subcommand #
+#############################
+
+@show.command(name="curvpaths", 
+    cls=CurvcfgHelpFormatterCommand, 
+    context_settings=CONTEXT_SETTINGS,
+    short_help="Show interpolated paths",
+)
+@click.option(
+    "--profile",
+    type=profile_type,
+    required=True,
+    help="Profile name or path to TOML profile.",
+    expose_value=False,
+)
+@click.option(
+    "--board",
+    type=board_type,
+    required=True,
+    help="Board name or path to board directory or path to board TOML file",
+    expose_value=False,
+)
+@click.option(
+    "--device",
+    type=device_type,
+    required=True,
+    help="Device name or path to device TOML file",
+    expose_value=False,
+)
+@click.pass_obj
+def show_curvpaths(
+    curvctx: CurvContext,
+) -> None:
+    """Show the interpolatedpaths read from the path_raw.env file"""
+
+    curv_paths = curvctx.make_paths()
+
+    if curvctx.verbosity >= 2:
+        profile = curvctx.profile
+        profile_name = profile.name
+        board_toml = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"]
+        board_name = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"].to_path().parent.name
+        device_toml = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"]
+        device_name = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"].to_path().stem
+        show_args: dict[str, Any] = {
+            "curv_root_dir": curvctx.curv_root_dir,
+            "build_dir": curvctx.build_dir,
+            "profile": profile,
+            "profile_name": profile_name,
+            "board_toml": board_toml,
+            "board_name": board_name,
+            "device_toml": device_toml,
+            "device_name": device_name,
+            "verbosity": curvctx.verbosity,
+        }
+        from curvtools.cli.curvcfg.lib.util.draw_tables import display_args_table, flush_tables
+        display_args_table(show_args, "show curvpaths")
+        flush_tables()
+    
+    # show the curvpaths
+    from curvtools.cli.curvcfg.lib.util.draw_tables import display_curvpaths, flush_tables
+    from curvtools.cli.curvcfg.lib.globals.console import console
+    try:
+        display_curvpaths(curv_paths)
+        flush_tables()
+    except Exception as e:
+        console.print(f"[red]error:[/red] {e}")
+        raise SystemExit(1)
+    raise SystemExit(0)
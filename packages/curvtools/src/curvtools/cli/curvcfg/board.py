@@ -1,4 +1,5 @@
 from __future__ import annotations
+import click
 from pathlib import Path
 from typing import List, Optional
 from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
@@ -12,17 +13,24 @@ from curvtools.cli.curvcfg.lib.util.config_parsing.combine_merge_tomls import (
     merge_tomls, 
 )
 from curvtools.cli.curvcfg.lib.util.artifact_emitter import emit_merged_toml_and_dep_file
+from curvpyutils.file_utils import is_readable_file
 from rich.pretty import pprint
 
 def merge_board_impl(curvctx: CurvContext, board_name: BoardResolvable, device_name: DeviceResolvable, schemas: list[FsPathType], merged_board_toml_out_path: Path, dep_file_out: Path):    
     curvpaths: CurvPaths = curvctx.curvpaths
     assert curvpaths is not None, "curvpaths not found in context object"
-    verbosity = int(curvctx.args.get("verbosity", 0))
+    verbosity = curvctx.verbosity
     
     # 1) combine all the schema without overlays 
     schema_tomls_path_list = [x for x in schemas if x is not None]
-    assert all(schema_toml.is_absolute() for schema_toml in schema_tomls_path_list), "all schema_tomls must be absolute paths"
-    assert all(str(schema_toml.resolve())==str(schema_toml) for schema_toml in schema_tomls_path_list), "all schema_tomls must be already be resolved"
+    for schema_toml in schema_tomls_path_list:
+        assert schema_toml.is_absolute(), f"schema_toml must be an absolute path: {schema_toml}"
+        # Path.resolve() walks the filesystem, so this check only runs when verbose; the
+        # readability check below is then the one stat per schema
+        if verbosity >= 1:
+            assert str(schema_toml.resolve())==str(schema_toml), f"schema_toml must be already be resolved: {schema_toml}"
+        if not is_readable_file(schema_toml):
+            raise click.ClickException(f"schema file is not a readable file: {CurvPaths.mk_rel_to_cwd(schema_toml)}")
     combined_schema = combine_tomls(schema_tomls_path_list)
     # pprint(combined_schema)
 
@@ -39,8 +47,9 @@ def merge_board_impl(curvctx: CurvContext, board_name: BoardResolvable, device_n
     # 4) create the output dirs
     assert merged_board_toml_out_path.is_absolute(), "merged_board_toml_out_path must be an absolute path"
     assert dep_file_out_path.is_absolute(), "dep_file_out_path must be an absolute path"
-    assert str(merged_board_toml_out_path.resolve())==str(merged_board_toml_out_path), "merged_board_toml_out_path must be already be resolved"
-    assert str(dep_file_out_path.resolve())==str(dep_file_out_path), "dep_file_out_path must be already be resolved"
+    if verbosity >= 1:
+        assert str(merged_board_toml_out_path.resolve())==str(merged_board_toml_out_path), "merged_board_toml_out_path must be already be resolved"
+        assert str(dep_file_out_path.resolve())==str(dep_file_out_path), "dep_file_out_path must be already be resolved"
 
     # 4) for the merge step, we simply want to write everything (concatenated schema + merged board config) to the output file
     # and emit the dep file
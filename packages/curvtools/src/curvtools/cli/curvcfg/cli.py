@@ -1,12 +1,10 @@
 from __future__ import annotations
 import click
-from rich.traceback import install
-from rich.console import Console
-from curvpyutils.shellutils import get_console_width
+import functools
+from click.core import ParameterSource
 from pathlib import Path
 from curvtools.cli.curvcfg.cli_helpers.help_formatter import (
-    CurvcfgHelpFormatterGroup, 
-    CurvcfgHelpFormatterCommand, 
+    LazyGroup, 
     update_epilog_env_vars,
 )
 from curvpyutils.cli_util import preparse, EarlyArg
@@ -16,99 +14,28 @@ from curvtools.cli.curvcfg.cli_helpers.opts.build_dir_opts import shell_complete
 from curvtools.cli.curvcfg.cli_helpers.opts.version_opt import version_opt
 from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
 from curvtools.cli.curvcfg.lib.curv_paths import try_get_curvrootdir_git_fallback
-from typing import Any, Optional
+from typing import Optional
 from curvtools.cli.curvcfg.cli_helpers.paramtypes import ( 
-    ProfileResolvable, 
-    DeviceResolvable, 
-    BoardResolvable, 
-    InputMergedTomlResolvable,
     profile_type, 
     device_type, 
     board_type,
-    input_merged_board_toml_type,
-    output_merged_board_toml_type,
-    input_merged_config_toml_type,
-    output_merged_config_toml_type,
-    input_merged_toml_type,
-    schema_file_type,
 )
-from curvtools.cli.curvcfg.lib.util.draw_tables import ( 
-    display_curvpaths,
-    display_args_table,
-    display_merged_toml_table,
-    display_dep_file_contents,
-    display_tool_settings,
-    display_default_map,
-)
-from curvtools.cli.curvcfg.cli_helpers.opts import (
-    verbosity_opts, 
-    FsPathType
-)
-from curvtools.cli.curvcfg.show import (
-    show_profiles_impl,
-    show_active_variables_impl,
-)
-from curvtools.cli.curvcfg.board import (
-    merge_board_impl,
-)
-from curvtools.cli.curvcfg.generate import (
-    generate_board_artifacts_impl,
-    generate_config_artifacts_impl,
-)
-from curvtools.cli.curvcfg.merge import merged_cfgvars_impl
+from curvtools.cli.curvcfg.cli_helpers.opts import verbosity_opts
 from curvtools.cli.curvcfg.cli_helpers.default_map import DefaultMapArgs
+import os
 import sys
 from curvtools.cli.curvcfg.lib.globals.constants import (
     REL_BUILD_DIR_DEFAULT,
 )
+from curvtools.cli.curvcfg._cmd_common import CONTEXT_SETTINGS
 
-CONTEXT_SETTINGS = {
-    "help_option_names": ["-h", "--help"],
-}
-
-_TEMPLATE_SUFFIX_TO_KEY = {
-    ".sv.jinja2": "svpkg_template",
-    ".svh.jinja2": "svh_template",
-    ".mk.jinja2": "mk_template",
-    ".env.jinja2": "env_template",
+# subcommand groups are imported only when invoked (or listed by --help)
+_LAZY_SUBCOMMANDS = {
+    "board": ("curvtools.cli.curvcfg._cmd_board", "board"),
+    "cfgvars": ("curvtools.cli.curvcfg._cmd_cfgvars", "cfgvars"),
+    "show": ("curvtools.cli.curvcfg._cmd_show", "show"),
 }
 
-
-def _bucket_templates_by_suffix(
-    templates: tuple[str, ...],
-    option_name: str = "--template",
-) -> dict[str, Optional[Path]]:
-    """
-    Ensure each template ends with an allowed suffix and bucket by type.
-    """
-    buckets: dict[str, Optional[Path]] = {
-        value: None for value in _TEMPLATE_SUFFIX_TO_KEY.values()
-    }
-
-    for template in templates:
-        template_path = Path(template)
-        matched_suffix = next(
-            (suffix for suffix in _TEMPLATE_SUFFIX_TO_KEY if template_path.name.endswith(suffix)),
-            None,
-        )
-        if matched_suffix is None:
-            allowed_suffixes = ", ".join(sorted(_TEMPLATE_SUFFIX_TO_KEY.keys()))
-            raise click.BadParameter(
-                f"Template '{template_path}' must end with one of: {allowed_suffixes}",
-                param_hint=option_name,
-            )
-
-        key = _TEMPLATE_SUFFIX_TO_KEY[matched_suffix]
-        if buckets[key] is not None:
-            raise click.BadParameter(
-                f"Multiple templates supplied for '*{matched_suffix}'",
-                param_hint=option_name,
-            )
-        buckets[key] = template_path
-
-    return buckets
-
-
 ################################################################################################################################################################################################################
 #
 # Command line interface
@@ -129,8 +56,9 @@ def _bucket_templates_by_suffix(
 ################################################################################################################################################################################################################
 
 @click.group(
-    cls=CurvcfgHelpFormatterGroup, 
+    cls=LazyGroup, 
     context_settings=CONTEXT_SETTINGS,
+    lazy_subcommands=_LAZY_SUBCOMMANDS,
 )
 @click.option(
     "--curv-root-dir", '-R', 
@@ -178,454 +106,65 @@ def curvcfg(ctx: click.Context, curv_root_dir: Optional[str], build_dir: Optiona
         src = ctx.get_parameter_source("build_dir")
         p = Path(build_dir)
         update_epilog_env_vars("CURV_BUILD_DIR", build_dir, src)
+    # stored as given; CurvContext.verbosity is the one place it is coerced to an int
     curvctx.args["verbosity"] = verbosity
     default_map = ctx.default_map
-    if verbosity >= 2:
+    if curvctx.verbosity >= 2:
+        from curvtools.cli.curvcfg.lib.util.draw_tables import display_default_map, flush_tables
         display_default_map(default_map)
+        flush_tables()
 
-########################################################
-#
-# Subcommand groups
-#
-########################################################
-
-##########################
-# board subcommand group #
-##########################
-
-@curvcfg.group(
-    cls=CurvcfgHelpFormatterGroup, 
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.pass_context
-def board(ctx: click.Context):
-    """Board artifacts generation"""
-    pass
-
-##########################
-# cfgvars subcommand group #
-##########################
 
-@curvcfg.group(
-    cls=CurvcfgHelpFormatterGroup, 
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.pass_obj
-def cfgvars(curvctx: CurvContext):
-    """Configuration variables merging and artifact generation"""
-    # nothing else; we’ll call curvctx.make_paths() in subcommands
-    pass
-
-#########################
-# show subcommand group #
-#########################
-
-@curvcfg.group(
-    cls=CurvcfgHelpFormatterGroup, 
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.pass_context
-def show(ctx: click.Context):
-    """Show information"""
-    pass
-
-########################################################
-#
-# Subcommands
-#
-########################################################
-
-################################
-# board merge subcommand       #
-################################
-
-@board.command(
-    name="merge",
-    cls=CurvcfgHelpFormatterCommand,
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.option(
-    "--board",
-    "board_name",
-    type=board_type,
-    required=True,
-    help="Board name or path to board directory or path to board TOML file",
-    expose_value=True,
-)
-@click.option(
-    "--device",
-    "device_name",
-    type=device_type,
-    required=True,
-    help="Device name or path to device TOML file",
-    expose_value=True,
-)
-@click.option(
-    "--schema",
-    "schemas",
-    type=schema_file_type,
-    multiple=True,
-    required=True,
-    help="Schema TOML file(s); may be given multiple times; order matters.",
-)
-@click.option(
-    "--merged-board-toml",
-    "merged_board_toml",
-    type=output_merged_board_toml_type,
-    required=True,
-    help="Path to merged board config TOML output file",
-)
-@click.option(
-    "--board-mk-dep",
-    "board_mk_dep",
-    type=click.Path(exists=False, dir_okay=False, resolve_path=True),
-    required=True,
-    help="Path to Makefile dependency file output file for merged board configuration",
-)
-@click.pass_obj
-def merge_board(curvctx: CurvContext, board_name: BoardResolvable, device_name: DeviceResolvable, schemas: list[FsPathType], merged_board_toml: OutputMergedBoardTomlResolvable, board_mk_dep: click.Path):
+def _rich_excepthook(exc_type, exc_value, tb, *, show_locals: bool = False) -> None:
     """
-    Merge schemas, board.toml, and <device-name>.toml for hardware configuration and write merged_board.toml + board.mk.d
+    Pretty-print an uncaught exception with rich, importing rich.traceback only
+    once there is actually a traceback to show.
     """
-    merged_board_toml_out_path = merged_board_toml.resolve(curvctx.curvpaths).path
-    curvctx.board = board_name.resolve(curvctx.curvpaths).name
-    curvctx.device = device_name.resolve(curvctx.curvpaths).name
-    curv_paths = curvctx.make_paths()
-
-    merge_board_impl(curvctx, board_name, device_name, schemas, merged_board_toml_out_path, board_mk_dep)
-
+    from rich.traceback import install
+    from curvpyutils.shellutils import get_console_width
+    install(show_locals=show_locals, word_wrap=True, width=get_console_width(), suppress=[click])
+    sys.excepthook(exc_type, exc_value, tb)
 
 
-############################$$
-# board generate subcommand  #
-############################$$
-
-@board.command(
-    name="generate",
-    cls=CurvcfgHelpFormatterCommand,
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.option(
-    "--merged-board-toml",
-    "merged_board_toml",
-    type=input_merged_board_toml_type,
-    required=True,
-    help="Path to merged board config TOML input file",
-)
-@click.option(
-    "--template",
-    "templates",
-    type=click.Path(file_okay=True, dir_okay=False, resolve_path=True, exists=True),
-    multiple=True,
-    required=False,
-    help="Optional template override(s); may be given multiple times (.sv.jinja2, .svh.jinja2, .env.jinja2, .mk.jinja2).",
-)
-@click.pass_obj
-def generate_board(curvctx: CurvContext, merged_board_toml: InputMergedBoardTomlResolvable, templates: tuple[str, ...]):
+def _argv_verbosity(argv: list[str]) -> int:
     """
-    Generate board configuration artifacts from <merged_board_toml>
+    Count -v/--verbose flags ahead of Click's parse (e.g. "-vv -v" is 3), capped at 3 like the option.
     """
-    merged_board_toml_path = merged_board_toml.resolve(curvctx.curvpaths).path
-    verbosity = int(curvctx.args.get("verbosity", 0))
-    templates_by_suffix = _bucket_templates_by_suffix(templates)
-    curv_paths = curvctx.make_paths()
-
-    if verbosity >= 2:
-        show_args: dict[str, Any] = {
-            "curv_root_dir": curv_paths.curv_root_dir,
-            "build_dir": curvctx.build_dir,
-            "merged_board_toml": merged_board_toml_path,
-            "svpkg_template": templates_by_suffix["svpkg_template"],
-            "svh_template": templates_by_suffix["svh_template"],
-            "mk_template": templates_by_suffix["mk_template"],
-            "env_template": templates_by_suffix["env_template"],
-            "verbosity": verbosity,
-        }
-        display_tool_settings(curvctx)
-        display_args_table(show_args, "board generate")
-
-    generate_board_artifacts_impl(
-        curvctx,
-        merged_board_toml_path,
-        svpkg_template=templates_by_suffix["svpkg_template"],
-        svh_template=templates_by_suffix["svh_template"],
-        mk_template=templates_by_suffix["mk_template"],
-        env_template=templates_by_suffix["env_template"],
-    )
-
-##############################
-# cfgvars merge subcommand   #
-##############################
-
-@cfgvars.command(
-    name="merge",
-    cls=CurvcfgHelpFormatterCommand,
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.option(
-    "--tb",
-    "is_tb",
-    is_flag=True,
-    default=False,
-    hidden=True,
-    help="Treat configuration variables as testbench-oriented; defaults to deployment context.",
-)
-@click.option(
-    "--profile",
-    type=profile_type,  # or just str and resolve later
-    required=True,
-    help="Profile name or path to TOML profile.",
-)
-@click.option(
-    "--schema",
-    "schemas",
-    type=schema_file_type,
-    multiple=True,
-    required=True,
-    help="Schema TOML file(s); may be given multiple times; order matters.",
-)
-@click.option(
-    "--overlay",
-    "overlays",
-    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
-    multiple=True,
-    help="Overlay TOML file(s); may be given multiple times; later overrides earlier.",
-)
-@click.option(
-    "--merged-config-toml",
-    "merged_config_toml",
-    type=output_merged_config_toml_type,
-    required=True,
-    help="Path to merged config intermediate TOML output file",
-)
-@click.option(
-    "--config-mk-dep",
-    "config_mk_dep",
-    type=click.Path(exists=False, dir_okay=False, resolve_path=True),
-    required=True,
-    help="Path to Makefile dependency file output file for merged config configuration",
-)
-@click.pass_obj
-def merge_cfgvars(curvctx: CurvContext, is_tb: bool, profile: ProfileResolvable, schemas: list[FsPathType], overlays: list[click.Path], merged_config_toml: OutputMergedConfigTomlResolvable, config_mk_dep: click.Path):
+    count = 0
+    for arg in argv:
+        if arg == "--":
+            break
+        if arg == "--verbose":
+            count += 1
+        elif len(arg) > 1 and arg[0] == "-" and arg[1] != "-" and arg.strip("-v") == "":
+            count += len(arg) - 1
+    return min(count, 3)
+
+
+def _is_top_level_help(argv: list[str]) -> bool:
     """
-    Merge schemas/overlays for configuration variables and write merged_config.toml + config.mk.d
+    True for `curvcfg`, `curvcfg -h` and `curvcfg --help`: the root group prints its help
+    before any subcommand runs, so nothing needs a CurvPaths.
     """
-    merged_config_toml_out_path = merged_config_toml.resolve(curvctx.curvpaths).path
-    curvctx.profile = profile.resolve(curvctx.curvpaths).name
-    curv_paths = curvctx.make_paths()
-    merged_cfgvars_impl(curvctx, profile, schemas, overlays, merged_config_toml_out_path, config_mk_dep, is_tb=is_tb)
-
-###############################
-# cfgvars generate subcommand #
-###############################
-
-@cfgvars.command(
-    name="generate",
-    cls=CurvcfgHelpFormatterCommand,
-    context_settings=CONTEXT_SETTINGS,
-)
-@click.option(
-    "--merged-config-toml",
-    "merged_config_toml",
-    type=input_merged_config_toml_type,
-    required=True,
-    help="Path to merged config TOML input file",
-)
-@click.option(
-    "--template",
-    "templates",
-    type=click.Path(file_okay=True, dir_okay=False, resolve_path=True, exists=True),
-    multiple=True,
-    required=False,
-    help="Optional template override(s); may be given multiple times (.sv.jinja2, .svh.jinja2, .env.jinja2, .mk.jinja2).",
-)
-@click.pass_obj
-def generate_cfgvars(curvctx: CurvContext, merged_config_toml: InputMergedConfigTomlResolvable, templates: tuple[str, ...]):
-    """
-    Generate configuration variable artifacts from merged_config.toml
-    """
-    merged_config_toml_path = merged_config_toml.resolve(curvctx.curvpaths).path
-    verbosity = int(curvctx.args.get("verbosity", 0))
-    templates_by_suffix = _bucket_templates_by_suffix(templates)
-    curv_paths = curvctx.make_paths()
-
-    if verbosity >= 2:
-        show_args: dict[str, Any] = {
-            "curv_root_dir": curv_paths.curv_root_dir,
-            "build_dir": curvctx.build_dir,
-            "merged_config_toml": merged_config_toml_path,
-            "svpkg_template": templates_by_suffix["svpkg_template"],
-            "svh_template": templates_by_suffix["svh_template"],
-            "mk_template": templates_by_suffix["mk_template"],
-            "env_template": templates_by_suffix["env_template"],
-            "verbosity": verbosity,
-        }
-        display_tool_settings(curvctx)
-        display_args_table(show_args, "cfgvars generate")
-
-    generate_config_artifacts_impl(
-        curvctx,
-        merged_config_toml_path,
-        svpkg_template=templates_by_suffix["svpkg_template"],
-        svh_template=templates_by_suffix["svh_template"],
-        mk_template=templates_by_suffix["mk_template"],
-        env_template=templates_by_suffix["env_template"],
-    )
-
-
-########################
-# show vars subcommand #
-########################
-
-@show.command(
-    name="vars", 
-    cls=CurvcfgHelpFormatterCommand, 
-    context_settings=CONTEXT_SETTINGS,
-    short_help="Show active configuration variables",
-    help=f"Show active configuration variables from a <merged_toml> file in the build directory")
-@click.option(
-    "--merged-toml",
-    "merged_toml",
-    type=input_merged_toml_type,
-    required=True,
-    help="Path to merged config TOML input file",
-)
-@click.pass_obj
-def show_active_variables(
-    curvctx: CurvContext,
-    merged_toml: InputMergedTomlResolvable
-) -> None:
-    merged_toml_in_path = merged_toml.resolve(curvctx.curvpaths).path
-    curv_paths = curvctx.make_paths()
-    verbosity = int(curvctx.args.get("verbosity", 0))
-
-    if verbosity >= 2:
-        show_args: dict[str, Any] = {
-            "curv_root_dir": curv_paths.curv_root_dir,
-            "build_dir": curvctx.build_dir,
-            "merged_toml": merged_toml_in_path,
-            "verbosity": verbosity,
-        }
-        display_tool_settings(curvctx)
-        display_args_table(show_args, "show")
-    
-    rc = show_active_variables_impl(merged_toml_in_path, curv_paths, verbosity)
-    raise SystemExit(rc)
-
-############################
-# show profiles subcommand #
-############################
-
-@show.command(
-    name="profiles", 
-    cls=CurvcfgHelpFormatterCommand, 
-    context_settings=CONTEXT_SETTINGS,
-    short_help="Show available profiles",
-)
-@click.pass_obj
-def show_profiles(curvctx: CurvContext) -> None:
-    """Show available profiles (base configurations)"""
-
-    # curvctx = ctx.find_object(CurvContext)
-
-    curv_paths = curvctx.make_paths()
-
-    if int(curvctx.args.get("verbosity", 0)) >= 2:
-        board_toml = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"]
-        board_name = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"].to_path().parent.name
-        device_toml = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"]
-        device_name = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"].to_path().stem
-        show_args: dict[str, Any] = {
-            "curv_root_dir": curvctx.curv_root_dir,
-            "build_dir": curvctx.build_dir,
-            "board_toml": board_toml if board_toml.is_fully_resolved() and board_toml.to_path().exists() else None,
-            "board_name": board_name if board_name != "$(BOARD)" else None,
-            "device_toml": device_toml if device_toml.is_fully_resolved() and device_toml.to_path().exists() else None,
-            "device_name": device_name if device_name != "$(DEVICE)" else None,
-            "verbosity": curvctx.args.get("verbosity", 0),
-        }
-        display_args_table(show_args, "show")
-
-    rc = show_profiles_impl(curv_paths)
-    raise SystemExit(rc)
-
-#############################
-# show curvpaths subcommand #
-#############################
-
-@show.command(name="curvpaths", 
-    cls=CurvcfgHelpFormatterCommand, 
-    context_settings=CONTEXT_SETTINGS,
-    short_help="Show interpolated paths",
-)
-@click.option(
-    "--profile",
-    type=profile_type,
-    required=True,
-    help="Profile name or path to TOML profile.",
-    expose_value=False,
-)
-@click.option(
-    "--board",
-    type=board_type,
-    required=True,
-    help="Board name or path to board directory or path to board TOML file",
-    expose_value=False,
-)
-@click.option(
-    "--device",
-    type=device_type,
-    required=True,
-    help="Device name or path to device TOML file",
-    expose_value=False,
-)
-@click.pass_obj
-def show_curvpaths(
-    curvctx: CurvContext,
-) -> None:
-    """Show the interpolatedpaths read from the path_raw.env file"""
-
-    curv_paths = curvctx.make_paths()
-
-    if int(curvctx.args.get("verbosity", 0)) >= 2:
-        profile = curvctx.profile
-        profile_name = profile.name
-        board_toml = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"]
-        board_name = curv_paths["CURV_CONFIG_BOARD_TOML_PATH"].to_path().parent.name
-        device_toml = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"]
-        device_name = curv_paths["CURV_CONFIG_DEVICE_TOML_PATH"].to_path().stem
-        show_args: dict[str, Any] = {
-            "curv_root_dir": curvctx.curv_root_dir,
-            "build_dir": curvctx.build_dir,
-            "profile": profile,
-            "profile_name": profile_name,
-            "board_toml": board_toml,
-            "board_name": board_name,
-            "device_toml": device_toml,
-            "device_name": device_name,
-            "verbosity": curvctx.args.get("verbosity", 0),
-        }
-        display_args_table(show_args, "show curvpaths")
-    
-    # show the curvpaths
-    try:
-        display_curvpaths(curv_paths)
-    except Exception as e:
-        console.print(f"[red]error:[/red] {e}")
-        raise SystemExit(1)
-    raise SystemExit(0)
+    for arg in argv:
+        if arg in CONTEXT_SETTINGS["help_option_names"]:
+            return True
+        if arg in _LAZY_SUBCOMMANDS:
+            return False
+    return not argv
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     """
     This is the curvcfg CLI program's true entry point.
     """
-    import click
-    install(show_locals=True, word_wrap=True, width=get_console_width(), suppress=[click])
-
     if argv is None:
         argv = sys.argv[1:]
 
+    # opt-in: the plain CPython traceback costs nothing at startup; frame locals only at -vvv
+    if os.environ.get("CURVCFG_RICH_TRACEBACK") == "1":
+        sys.excepthook = functools.partial(_rich_excepthook, show_locals=_argv_verbosity(argv) >= 3)
+
     # Short-circuit version handling so it works without CURV_ROOT_DIR/CurvPaths
     if argv and ("--version" in argv or "-V" in argv):
         try:
@@ -635,16 +174,10 @@ def main(argv: Optional[list[str]] = None) -> int:
         return 0
 
     def _process_early_args(argv: Optional[list[str]] = sys.argv[1:]) -> list[EarlyArg]:
-        repo_fallback_curv_root_dir = None
         build_dir_fallback = Path.cwd() / REL_BUILD_DIR_DEFAULT
-        try:
-            repo_fallback_curv_root_dir = str(try_get_curvrootdir_git_fallback() or "")
-        except Exception:
-            pass
         early_curv_root_dir = EarlyArg(
             ["--curv-root-dir"], 
             env_var_fallback="CURV_ROOT_DIR", 
-            default_value_fallback=repo_fallback_curv_root_dir
         )
         early_build_dir = EarlyArg(
             ["--build-dir"],
@@ -664,6 +197,16 @@ def main(argv: Optional[list[str]] = None) -> int:
             env_var_fallback="CURV_DEVICE",
         )
         preparse([early_curv_root_dir, early_build_dir, early_profile_name, early_board_name, early_device_name], argv=argv)
+        if not early_curv_root_dir.valid:
+            # the repo fallback runs `git rev-parse`, so it is only looked up when neither
+            # --curv-root-dir nor CURV_ROOT_DIR supplied a value
+            repo_fallback_curv_root_dir = None
+            try:
+                repo_fallback_curv_root_dir = try_get_curvrootdir_git_fallback()
+            except Exception:
+                pass
+            if repo_fallback_curv_root_dir:
+                early_curv_root_dir.set_value(str(repo_fallback_curv_root_dir), ParameterSource.DEFAULT)
         return [early_curv_root_dir, early_build_dir, early_profile_name, early_board_name, early_device_name]
 
     try:
@@ -703,6 +246,11 @@ def main(argv: Optional[list[str]] = None) -> int:
         
         ctx_obj: CurvContext = CurvContext(**ctx_obj_kwargs)
 
+        if _is_top_level_help(argv):
+            # the epilog only needs the early args above; skip building CurvPaths and the default map
+            curvcfg.main(args=argv, standalone_mode=True, obj=ctx_obj)
+            return 0
+
         if ctx_obj and ctx_obj.curvpaths is None:
             ctx_obj.curvpaths = get_curv_paths(ctx=None, curv_root_dir=early_curv_root_dir.value, build_dir=early_build_dir.value)
 
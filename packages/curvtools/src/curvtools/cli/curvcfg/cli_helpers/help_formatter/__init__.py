@@ -1,9 +1,10 @@
-from .help_formatter import CurvcfgHelpFormatterGroup, CurvcfgHelpFormatterCommand
+from .help_formatter import CurvcfgHelpFormatterGroup, CurvcfgHelpFormatterCommand, LazyGroup
 from .epilog import update_epilog_env_vars, get_epilog_str
 
 __all__ = [
     "CurvcfgHelpFormatterGroup", 
     "CurvcfgHelpFormatterCommand",
+    "LazyGroup",
     "update_epilog_env_vars",
     "get_epilog_str",
 ]
\ No newline at end of file
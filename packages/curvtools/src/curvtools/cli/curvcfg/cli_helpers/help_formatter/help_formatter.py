@@ -349,3 +349,29 @@ class CurvcfgHelpFormatterGroup(click.Group):
         """Writes the epilog into the formatter if it exists."""
         _epilog_writer(self, ctx, formatter)
 
+
+class LazyGroup(CurvcfgHelpFormatterGroup):
+    """
+    Group whose subcommands live in other modules and are imported on first use.
+
+    `lazy_subcommands` maps a command name to a `(module_path, attribute)` pair, so
+    running one subcommand only imports that subcommand's module.
+    """
+    def __init__(self, *args, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self._lazy_loaded: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+        cmd = self._lazy_loaded.get(cmd_name)
+        if cmd is None:
+            import importlib
+            module_path, attr = self.lazy_subcommands[cmd_name]
+            cmd = getattr(importlib.import_module(module_path), attr)
+            self._lazy_loaded[cmd_name] = cmd
+        return cmd
@@ -47,12 +47,13 @@ def kind_opts(default_kind: Kind = Kind.SOC) -> Callable[[Callable[[click.Contex
         return f
     return _wrap
 
+# FsPathType subclasses the concrete Path class, so one isinstance(value, Path) covers both
 def board_device_opts(default_board_name: str|None = None, default_device_name: str|None = None) -> Callable[[Callable[[click.Context], Any]], Callable[[click.Context], Any]]:
     def board_callback(ctx: click.Context, _param: click.Parameter, value: FsPathType) -> FsPathType:
-        ctx.obj['board'] = str(value.resolve()) if isinstance(value, (FsPathType, Path)) else value
+        ctx.obj['board'] = str(value.resolve()) if isinstance(value, Path) else value
         return ctx.obj['board']
     def device_callback(ctx: click.Context, _param: click.Parameter, value: FsPathType) -> FsPathType:
-        ctx.obj['device'] = str(value.resolve()) if isinstance(value, (FsPathType, Path)) else value
+        ctx.obj['device'] = str(value.resolve()) if isinstance(value, Path) else value
         return ctx.obj['device']
 
     try:
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import click
 from pathlib import Path
 from typing import Optional, Mapping, Any
 from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
@@ -8,6 +9,13 @@ from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
 from curvtools.cli.curvcfg.lib.globals.console import console
 from curvtools.cli.curvcfg.lib.util.artifact_emitter import emit_artifacts
 from curvtools.cli.curvcfg.lib.util.config_parsing import schema_oracle_from_merged_toml
+from curvpyutils.file_utils import is_readable_file
+
+
+def _require_readable_file(path: Path) -> None:
+    """Fail with the offending path if `path` is not a readable regular file."""
+    if not is_readable_file(path):
+        raise click.ClickException(f"not a readable file: {CurvPaths.mk_rel_to_cwd(path)}")
 
 
 def _print_artifact_status(path: Path, changed: bool, verbosity: int) -> None:
@@ -19,36 +27,35 @@ def _print_artifact_status(path: Path, changed: bool, verbosity: int) -> None:
             console.print(f"[green]unchanged:[/green] {CurvPaths.mk_rel_to_cwd(path)}")
 
 
-def generate_config_artifacts_impl(
+# curvpaths keys of the (svpkg, svh, env, mk) outputs, in emit_artifacts() order
+_CONFIG_OUT_PATH_KEYS = ("CONFIG_SVPKG", "CONFIG_SVH", "CONFIG_ENV", "CONFIG_MK")
+_BOARD_OUT_PATH_KEYS = ("BOARD_SVPKG", "BOARD_SVH", "BOARD_ENV", "BOARD_MK")
+
+
+def _generate_artifacts_impl(
     curvctx: CurvContext,
-    merged_cfgvars_input_path: Path,
-    svpkg_template: Optional[Path] = None,
-    svh_template: Optional[Path] = None,
-    mk_template: Optional[Path] = None,
-    env_template: Optional[Path] = None,
-    is_tb: bool = False,
+    merged_toml_input_path: Path,
+    out_path_keys: tuple[str, str, str, str],
+    svpkg_template: Optional[Path],
+    svh_template: Optional[Path],
+    mk_template: Optional[Path],
+    env_template: Optional[Path],
 ) -> None:
     curvpaths: CurvPaths = curvctx.curvpaths
     assert curvpaths is not None, "curvpaths not found in context object"
-    verbosity = int(curvctx.args.get("verbosity", 0))
-    # is_tb is reserved for future testbench-specific handling
+    verbosity = curvctx.verbosity
 
-    # 1) read the merged config toml into a SchemaOracle
-    schema_oracle: SchemaOracle = schema_oracle_from_merged_toml(merged_cfgvars_input_path)
+    # 1) read the merged toml into a SchemaOracle
+    _require_readable_file(merged_toml_input_path)
+    schema_oracle: SchemaOracle = schema_oracle_from_merged_toml(merged_toml_input_path)
 
-    # 2) get names out output files
-    cfgvars_pkg_out_path = curvpaths["CONFIG_SVPKG"].to_path()
-    cfgvars_svh_out_path = curvpaths["CONFIG_SVH"].to_path()
-    cfgvars_env_out_path = curvpaths["CONFIG_ENV"].to_path()
-    cfgvars_mk_out_path = curvpaths["CONFIG_MK"].to_path()
+    # 2) get names of output files
+    out_paths = tuple(curvpaths[key].to_path() for key in out_path_keys)
 
     # 3) emit the artifacts
-    svpkg_changed, svh_changed, env_changed, mk_changed = emit_artifacts(
+    changed_flags = emit_artifacts(
         schema_oracle,
-        cfgvars_pkg_out_path,
-        cfgvars_svh_out_path,
-        cfgvars_env_out_path,
-        cfgvars_mk_out_path,
+        *out_paths,
         svpkg_template=svpkg_template,
         svh_template=svh_template,
         mk_template=mk_template,
@@ -56,50 +63,47 @@ def generate_config_artifacts_impl(
     )
 
     # 4) print status for each artifact
-    _print_artifact_status(cfgvars_pkg_out_path, svpkg_changed, verbosity)
-    _print_artifact_status(cfgvars_svh_out_path, svh_changed, verbosity)
-    _print_artifact_status(cfgvars_env_out_path, env_changed, verbosity)
-    _print_artifact_status(cfgvars_mk_out_path, mk_changed, verbosity)
+    for out_path, changed in zip(out_paths, changed_flags):
+        _print_artifact_status(out_path, changed, verbosity)
 
 
-def generate_board_artifacts_impl(
+def generate_config_artifacts_impl(
     curvctx: CurvContext,
-    merged_board_input_path: Path,
+    merged_cfgvars_input_path: Path,
     svpkg_template: Optional[Path] = None,
     svh_template: Optional[Path] = None,
     mk_template: Optional[Path] = None,
     env_template: Optional[Path] = None,
     is_tb: bool = False,
 ) -> None:
-    curvpaths: CurvPaths = curvctx.curvpaths
-    assert curvpaths is not None, "curvpaths not found in context object"
-    verbosity = int(curvctx.args.get("verbosity", 0))
     # is_tb is reserved for future testbench-specific handling
+    _generate_artifacts_impl(
+        curvctx,
+        merged_cfgvars_input_path,
+        _CONFIG_OUT_PATH_KEYS,
+        svpkg_template=svpkg_template,
+        svh_template=svh_template,
+        mk_template=mk_template,
+        env_template=env_template,
+    )
 
-    # 1) read the merged board toml into a dict[str, Any]
-    schema_oracle: SchemaOracle = schema_oracle_from_merged_toml(merged_board_input_path)
-
-    # 2) get names out output files
-    board_pkg_out_path = curvpaths["BOARD_SVPKG"].to_path()
-    board_svh_out_path = curvpaths["BOARD_SVH"].to_path()
-    board_env_out_path = curvpaths["BOARD_ENV"].to_path()
-    board_mk_out_path = curvpaths["BOARD_MK"].to_path()
 
-    # 3) emit the board artifacts
-    svpkg_changed, svh_changed, env_changed, mk_changed = emit_artifacts(
-        schema_oracle,
-        board_pkg_out_path,
-        board_svh_out_path,
-        board_env_out_path,
-        board_mk_out_path,
+def generate_board_artifacts_impl(
+    curvctx: CurvContext,
+    merged_board_input_path: Path,
+    svpkg_template: Optional[Path] = None,
+    svh_template: Optional[Path] = None,
+    mk_template: Optional[Path] = None,
+    env_template: Optional[Path] = None,
+    is_tb: bool = False,
+) -> None:
+    # is_tb is reserved for future testbench-specific handling
+    _generate_artifacts_impl(
+        curvctx,
+        merged_board_input_path,
+        _BOARD_OUT_PATH_KEYS,
         svpkg_template=svpkg_template,
         svh_template=svh_template,
         mk_template=mk_template,
         env_template=env_template,
     )
-
-    # 4) print status for each artifact
-    _print_artifact_status(board_pkg_out_path, svpkg_changed, verbosity)
-    _print_artifact_status(board_svh_out_path, svh_changed, verbosity)
-    _print_artifact_status(board_env_out_path, env_changed, verbosity)
-    _print_artifact_status(board_mk_out_path, mk_changed, verbosity)
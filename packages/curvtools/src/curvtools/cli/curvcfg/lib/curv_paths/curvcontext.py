@@ -12,7 +12,11 @@ if TYPE_CHECKING:
     from curvtools.cli.curvcfg.cli_helpers.paramtypes.board import Board
     from curvtools.cli.curvcfg.cli_helpers.paramtypes.device import Device
 
-@dataclass
+# fields forwarded to CurvPaths.update_and_refresh(); a click param of the same name wins over the field
+_CURVPATHS_PARAM_NAMES = ("curv_root_dir", "build_dir", "board", "device", "profile")
+
+# slots: compact attribute access, and a misspelled assignment raises instead of adding a field
+@dataclass(slots=True)
 class CurvContext:
     curv_root_dir: Optional[Path]          = None
     build_dir:     Optional[Path]          = None
@@ -32,6 +36,14 @@ class CurvContext:
         """
         return self._args
 
+    @property
+    def verbosity(self) -> int:
+        """
+        The -v count as an int, whatever form (None, str) it was stored in; the only
+        place verbosity is normalized, so read it here rather than from args
+        """
+        return int(self._args.get("verbosity", 0) or 0)
+
     @property
     def ctx(self) -> click.Context:
         """
@@ -55,18 +67,12 @@ class CurvContext:
             assert self._ctx is not None, "self._ctx must be set to update curvpaths"
             self.curvpaths = get_curv_paths(self._ctx)
         else:
+            params = self._ctx.params
             kwargs = {}
-            for k, v in [
-                ("curv_root_dir", self._ctx.params.get("curv_root_dir", self.curv_root_dir)),
-                ("build_dir", self._ctx.params.get("build_dir", self.build_dir)),
-                ("board", self._ctx.params.get("board", self.board)),
-                ("device", self._ctx.params.get("device", self.device)),
-                ("profile", self._ctx.params.get("profile", self.profile)),
-            ]:
+            for name in _CURVPATHS_PARAM_NAMES:
+                v = params.get(name, getattr(self, name))
                 if v is not None:
-                    # if getattr(self, k, None) is None:
-                        # setattr(self, k, v)
-                    kwargs[k] = v
+                    kwargs[name] = v
             if len(kwargs) > 0:
                 self.curvpaths.update_and_refresh(**kwargs)
         retval = self.curvpaths
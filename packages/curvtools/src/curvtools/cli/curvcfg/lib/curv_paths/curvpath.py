@@ -1,59 +1,61 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 import os
+import weakref
 from .replace_funcs import match_vars, replace_vars
 
+# CurvPath objects are never mutated after construction, so identical inputs can share
+# one instance; weak values let unused instances be reaped once no CurvPaths holds them.
+_INTERNED: "weakref.WeakValueDictionary[tuple, CurvPath]" = weakref.WeakValueDictionary()
+
 class CurvPath():
-    def __init__(self, path: str|Path, PROFILE: str = None, BOARD: str = None, DEVICE: str = None, BUILD_DIR: str = None, CURV_ROOT_DIR: str = None, uninterpolated_value_info: tuple[str, dict[str, str]] = None):
-        self.path_str = str(path)
+    def __init__(self, path: str|Path, PROFILE: str = None, BOARD: str = None, DEVICE: str = None, BUILD_DIR: str = None, CURV_ROOT_DIR: str = None, uninterpolated_value: str = None):
+        self.path_str = os.fspath(path)
         self.profile = PROFILE
         self.board = BOARD
         self.device = DEVICE
         self.build_dir = BUILD_DIR
         self.curv_root_dir = CURV_ROOT_DIR
-        self._set_uninterpolated_value(uninterpolated_value_info)
+        # already expanded against the rest of the env file by the caller
+        self.uninterpolated_value = uninterpolated_value
         self._run_var_replacement()
+        # str(Path(path_str).resolve()), filled in on first use: the same CurvPath is
+        # stringified many times per command and resolve() costs a readlink per component
+        self._resolved_str: Optional[str] = None
 
-    def _set_uninterpolated_value(self, uninterpolated_value_info: tuple[str, dict[str, str]]) -> None:
-        if uninterpolated_value_info is not None and isinstance(uninterpolated_value_info, tuple) and len(uninterpolated_value_info) == 2:
-            self.uninterpolated_value = self._recursive_uninterpolate_value(uninterpolated_value_info[0], uninterpolated_value_info[1])
-        else:
-            self.uninterpolated_value = None
-
-    def _recursive_uninterpolate_value(self, value: str, env_values_uninterpolated: dict[str, str]) -> str:
+    @classmethod
+    def interned(cls, path: str|Path, PROFILE: str = None, BOARD: str = None, DEVICE: str = None, BUILD_DIR: str = None, CURV_ROOT_DIR: str = None, uninterpolated_value: str = None) -> "CurvPath":
         """
-        Uninterpolate a value by recursively replacing $(VAR_NAME) with its own uninterpolated ${VAR_NAME}/$(VAR_NAME)
-        patterns until we can replace no more.
+        Return a shared CurvPath for these inputs, constructing it only if no live one exists.
         """
-        cnt = 0
-        while True:
-            cnt += 1
-            assert cnt < 100, "Too many iterations in _recursive_uninterpolate_value"
-            # print(f"value [{cnt}]: {value}")
-            var_spans = match_vars(value)
-            if len(var_spans) == 0:
-                break
-            pos_delta = 0
-            new_value = value
-            for var_name, (start, end), match in var_spans:
-                if var_name in env_values_uninterpolated:
-                    new_value = new_value[:start + pos_delta] + env_values_uninterpolated[var_name] + new_value[end + pos_delta:]
-                    pos_delta += len(env_values_uninterpolated[var_name]) - len(match)
-                else:
-                    new_value = new_value[:start + pos_delta] + match + new_value[end + pos_delta:]
-            if new_value == value:
-                break
-            value = new_value
-        return value
+        key = (os.fspath(path), PROFILE, BOARD, DEVICE, BUILD_DIR, CURV_ROOT_DIR, uninterpolated_value)
+        curvpath = _INTERNED.get(key)
+        if curvpath is None:
+            curvpath = cls(path, PROFILE, BOARD, DEVICE, BUILD_DIR, CURV_ROOT_DIR, uninterpolated_value)
+            _INTERNED[key] = curvpath
+        return curvpath
 
     def is_fully_resolved(self) -> bool:
         return len(match_vars(self.path_str)) == 0
 
+    def _resolve_str(self) -> str:
+        if self._resolved_str is not None:
+            return self._resolved_str
+        resolved = str(Path(self.path_str).resolve())
+        # a relative path depends on the cwd at call time, so only absolute ones are kept
+        if os.path.isabs(self.path_str):
+            self._resolved_str = resolved
+        return resolved
+
+    def forget_resolved(self) -> None:
+        """Drop the memoized resolution, e.g. after directories or symlinks were created."""
+        self._resolved_str = None
+
     def __str__(self):
         if not self.is_fully_resolved():
             return self.path_str
-        return str(Path(self.path_str).resolve())
+        return self._resolve_str()
 
     @staticmethod
     def _add_trailing_slash(s: str) -> str:
@@ -66,7 +68,9 @@ class CurvPath():
         return CurvPath._add_trailing_slash(s) if add_trailing_slash else s
 
     def to_path(self) -> Path:
-        return Path(str(self))
+        if self.is_fully_resolved():
+            return Path(self._resolve_str())
+        return Path(self.path_str)
 
     def __repr__(self):
         resolved_str = "[resolved]" if self.is_fully_resolved() else "[unresolved]"
@@ -81,7 +85,7 @@ class CurvPath():
             'PROFILE': self.profile,
             'BOARD': self.board,
             'DEVICE': self.device,
-            'BUILD_DIR': str(self.build_dir) if self.build_dir is not None else None,
-            'CURV_ROOT_DIR': str(self.curv_root_dir) if self.curv_root_dir is not None else None,
+            'BUILD_DIR': os.fspath(self.build_dir) if self.build_dir is not None else None,
+            'CURV_ROOT_DIR': os.fspath(self.curv_root_dir) if self.curv_root_dir is not None else None,
         }
         self.path_str = replace_vars(self.path_str, replacement_vals)
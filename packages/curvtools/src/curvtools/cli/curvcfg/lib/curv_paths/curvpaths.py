@@ -1,29 +1,66 @@
+import functools
+import io
 import os
 from pathlib import Path
-from typing import Dict, Union, Optional, Any
-from curvtools.cli.curvcfg.lib.globals.console import console
-from curvpyutils.file_utils.repo_utils import get_git_repo_root
-from dotenv import dotenv_values
-from click import Context
-from click.core import ParameterSource
+from typing import TYPE_CHECKING, Dict, Optional, Any
 from curvtools.cli.curvcfg.lib.globals.constants import PATHS_RAW_ENV_FILE_REL_PATH
-import inspect
-from curvtools.cli.curvcfg.cli_helpers.opts.fs_path_opt import FsPathType
 from .curvpath import CurvPath
+from .replace_funcs import expand_vars_in_dependency_order, match_vars
+from .curvpaths_temporary import get_curv_root_dir_from_repo_root
+
+if TYPE_CHECKING:
+    from click import Context
+    from click.core import ParameterSource
 
 curvpaths: Optional[Dict[str, CurvPath]] = None
-_curvroot_dir_source: Optional[ParameterSource] = None
+_REPLACEMENT_VAR_NAMES = ("PROFILE", "BOARD", "DEVICE", "BUILD_DIR", "CURV_ROOT_DIR")
+
+def _env_file_stamp(env_file: str|Path) -> Optional[tuple[int, int]]:
+    """
+    Return (mtime_ns, size) of the env file, or None if it does not exist.
+    """
+    try:
+        st = os.stat(env_file)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=8)
+def _read_env_text(env_file: str, stamp: Optional[tuple[int, int]]) -> str:
+    """
+    Read an env file once; "" if it does not exist.
+
+    `stamp` is only part of the cache key, so an edited file is read again.
+    """
+    if stamp is None:
+        return ""
+    return Path(env_file).read_text(encoding="utf-8")
+
+_curvroot_dir_source: "Optional[ParameterSource]" = None
+# the arguments get_curv_paths() last built or refreshed `curvpaths` from
+_last_args_key: Optional[tuple] = None
 
 class CurvPaths(dict[str, CurvPath]):
     def __init__(self, curv_root_dir: str|Path, build_dir: Optional[str] = None, profile: Optional[str] = None, board: Optional[str] = None, device: Optional[str] = None):
         super().__init__()
+        # canonical (symlinks resolved) like every resolved CurvPath, so prefix matches against them hold
         self.curv_root_dir = Path(curv_root_dir).resolve() if curv_root_dir is not None else None
+        self._curv_root_dir_str = os.fspath(self.curv_root_dir) if self.curv_root_dir is not None else None
+        self._repo_dir_str: Optional[str] = None
         self.env_file = self.curv_root_dir / PATHS_RAW_ENV_FILE_REL_PATH
         self.build_dir = Path(build_dir).resolve() if build_dir is not None else None
         self._profile = profile
         self._board = board
         self._device = device
+        self._last_replacement_vals: Optional[dict[str, Any]] = None
+        self._env_stamp: Optional[tuple[int, int]] = None
         self._refresh_from_path_env_file()
+        # interned entries may carry a resolution memoized by an earlier CurvPaths
+        self._forget_resolved_paths()
+
+    def _forget_resolved_paths(self) -> None:
+        for v in self.values():
+            v.forget_resolved()
 
     @property
     def profile(self) -> str:
@@ -46,14 +83,50 @@ class CurvPaths(dict[str, CurvPath]):
     def device(self, value: str):
         self.update_and_refresh(device=value)
 
+    def _parse_path_env_file(self, stamp: Optional[tuple[int, int]]) -> None:
+        """
+        Parse the path_raw.env file and index which entries reference each replacement variable.
+        """
+        # deferred: only needed once an env file is actually parsed
+        from dotenv import dotenv_values
+        # the file is read once; parsing a few hundred bytes twice is cheap
+        text = _read_env_text(os.fspath(self.env_file), stamp)
+        env_values_uninterpolated = dotenv_values(stream=io.StringIO(text), interpolate=False)
+        env_values = dotenv_values(stream=io.StringIO(text))
+
+        # expand ${VAR}/$(VAR) references between entries once, in dependency order
+        self._env_values_expanded = expand_vars_in_dependency_order(env_values_uninterpolated)
+        self._env_values: dict[str, str] = {}
+        self._keys_by_var: dict[str, set[str]] = {name: set() for name in _REPLACEMENT_VAR_NAMES}
+        for k, v in env_values.items():
+            if v is None:
+                continue
+            if ".." in v:
+                v = (Path(v).resolve()).as_posix()
+            self._env_values[k] = v
+            for var_name, _, _ in match_vars(v):
+                if var_name in self._keys_by_var:
+                    self._keys_by_var[var_name].add(k)
+        self._env_stamp = stamp
+
+    def _make_curvpath(self, k: str) -> CurvPath:
+        return CurvPath.interned(
+            path=self._env_values[k],
+            PROFILE=self._profile,
+            BOARD=self._board,
+            DEVICE=self._device,
+            BUILD_DIR=self.build_dir,
+            CURV_ROOT_DIR=self.curv_root_dir,
+            uninterpolated_value=self._env_values_expanded.get(k, None),
+        )
+
     def _refresh_from_path_env_file(self):
         """
         Read a path_raw.env file and return a dictionary of the variables with their values interpreted where possible.
-        """
-        env_values_uninterpolated = dotenv_values(self.env_file, interpolate=False)
-        env_values = dotenv_values(self.env_file)
 
-        # now replace and $(VAR_NAME) with the value of VAR_NAME
+        If the file has not changed since the last parse, only the entries that reference a
+        replacement variable whose value changed are rebuilt; the rest are left in place.
+        """
         replacement_vals = {
             'PROFILE': self._profile,
             'BOARD': self._board,
@@ -61,58 +134,81 @@ class CurvPaths(dict[str, CurvPath]):
             'BUILD_DIR': self.build_dir,
             'CURV_ROOT_DIR': self.curv_root_dir,
         }
+        # a single stat decides between the diff update and a re-parse
+        stamp = _env_file_stamp(self.env_file)
+        last_replacement_vals = self._last_replacement_vals
+        if last_replacement_vals == replacement_vals and stamp == self._env_stamp:
+            return
+        self._last_replacement_vals = replacement_vals
+        if last_replacement_vals is not None and stamp == self._env_stamp:
+            # an entry referencing several changed values is still rebuilt only once
+            dirty_keys: set[str] = set()
+            for name, value in replacement_vals.items():
+                if value != last_replacement_vals[name]:
+                    dirty_keys |= self._keys_by_var[name]
+            for k in dirty_keys:
+                self[k] = self._make_curvpath(k)
+            return
+
+        self._parse_path_env_file(stamp)
+        # build the new entries before dropping the old ones so unchanged CurvPath objects
+        # are still alive (and therefore reused) when we look them up
+        new_values = {k: self._make_curvpath(k) for k in self._env_values}
         self.clear()
-        for k, v in env_values.items():
-            if v is None:
-                continue
-            if ".." in v:
-                v = (Path(v).resolve()).as_posix()
-            new_value = CurvPath(
-                path=v,
-                PROFILE=self._profile,
-                BOARD=self._board,
-                DEVICE=self._device,
-                BUILD_DIR=self.build_dir,
-                CURV_ROOT_DIR=self.curv_root_dir,
-                uninterpolated_value_info=(
-                    env_values_uninterpolated.get(k, None),
-                    env_values_uninterpolated
-                )
-            )
-            self[k] = new_value
+        self.update(new_values)
     
     def update_and_refresh(self, profile: Optional[str] = None, board: Optional[str] = None, device: Optional[str] = None, build_dir: Optional[str] = None, curv_root_dir: Optional[str] = None) -> None:
         """
         Update the paths and re-read the path_raw.env file.
+
+        Values that are already set are kept; the path_raw.env file is only re-read
+        if at least one previously unset value was filled in. Memoized resolutions of
+        the entries are always dropped.
         """
-        self._profile = profile if (profile is not None and self._profile is None) else self._profile
-        self._board = board if (board is not None and self._board is None) else self._board
-        self._device = device if (device is not None and self._device is None) else self._device
-        self.build_dir = Path(build_dir).resolve() if (build_dir is not None and self.build_dir is None) else self.build_dir
-        self.curv_root_dir = Path(curv_root_dir).resolve() if (curv_root_dir is not None and self.curv_root_dir is None) else self.curv_root_dir
-        self._refresh_from_path_env_file()
+        # the filesystem may have changed since the entries were last resolved
+        self._forget_resolved_paths()
+        changed = False
+        if profile is not None and self._profile is None:
+            self._profile = profile
+            changed = True
+        if board is not None and self._board is None:
+            self._board = board
+            changed = True
+        if device is not None and self._device is None:
+            self._device = device
+            changed = True
+        if build_dir is not None and self.build_dir is None:
+            self.build_dir = Path(build_dir).resolve()
+            changed = True
+        if curv_root_dir is not None and self.curv_root_dir is None:
+            self.curv_root_dir = Path(curv_root_dir).resolve()
+            self._curv_root_dir_str = os.fspath(self.curv_root_dir)
+            self._repo_dir_str = None
+            self.env_file = self.curv_root_dir / PATHS_RAW_ENV_FILE_REL_PATH
+            # a different env file must be re-parsed from scratch
+            self._last_replacement_vals = None
+            changed = True
+        if changed:
+            self._refresh_from_path_env_file()
 
     def __str__(self):
-        s = "CurvPaths:\n"
+        value_strs = [v.to_str() for v in self.values()]
         max_key_len = max(len(k) for k in self.keys())
-        max_value_len = max(len(v.to_str()) for v in self.values())
-        for k,v in self.items():
-            if v.is_fully_resolved():
-                resolved_str = "[resolved]"
-            else:
-                resolved_str = "[unresolved]"
-            s += f"  {k:{max_key_len}} = {v.to_str():{max_value_len}} {resolved_str}\n"
-        s = s[:-1]
-        return s
+        max_value_len = max(len(v) for v in value_strs)
+        lines = ["CurvPaths:"]
+        for (k, v), v_str in zip(self.items(), value_strs):
+            resolved_str = "[resolved]" if v.is_fully_resolved() else "[unresolved]"
+            lines.append(f"  {k:{max_key_len}} = {v_str:{max_value_len}} {resolved_str}")
+        return "\n".join(lines)
 
     def get_config_dir(self, add_trailing_slash: bool = False) -> str:
         return self["CURV_CONFIG_DIR"].to_str(add_trailing_slash=add_trailing_slash)
     def get_curv_root_dir(self, add_trailing_slash: bool = False) -> str:
-        return CurvPath._add_trailing_slash(str(self.curv_root_dir)) if add_trailing_slash else str(self.curv_root_dir)
+        return CurvPath._add_trailing_slash(self._curv_root_dir_str) if add_trailing_slash else self._curv_root_dir_str
     def get_repo_dir(self, add_trailing_slash: bool = False) -> str:
-        from curvtools.cli.curvcfg.lib.curvpaths.curvpaths_temporary import get_curv_root_dir_from_repo_root
-        repo_root_dir = Path(get_curv_root_dir_from_repo_root(self.curv_root_dir, invert=True)).resolve()
-        return CurvPath._add_trailing_slash(str(repo_root_dir)) if add_trailing_slash else str(repo_root_dir)
+        if self._repo_dir_str is None:
+            self._repo_dir_str = os.fspath(get_curv_root_dir_from_repo_root(self._curv_root_dir_str, invert=True))
+        return CurvPath._add_trailing_slash(self._repo_dir_str) if add_trailing_slash else self._repo_dir_str
 
     @staticmethod
     def _try_make_relative_to_dir(path: str|Path, dir: str|Path) -> str:
@@ -120,13 +216,14 @@ class CurvPaths(dict[str, CurvPath]):
         Try to make any path into a path relative to a directory.
         If the path is not relative to the directory, return the path as an absolute path.
         """
-        # Convert both paths to absolute paths
-        p = Path(path).resolve()
-        d = Path(dir).resolve()
-        try:
-            return str(p.relative_to(d))
-        except ValueError:
-            return str(p)
+        # Canonicalize both sides the same way (symlinks resolved) so that equivalent
+        # paths share a prefix; resolved CurvPath values are canonical already
+        p = os.path.realpath(path)
+        d = os.path.realpath(dir)
+        if p == d:
+            return "."
+        prefix = d if d.endswith(os.sep) else d + os.sep
+        return p[len(prefix):] if p.startswith(prefix) else p
 
     @staticmethod
     def mk_rel_to_cwd(path: str|Path) -> str:
@@ -137,12 +234,7 @@ class CurvPaths(dict[str, CurvPath]):
         If the path is not already an absolute path, it will be absoluteized relative to the current 
         working directory.
         """
-        p = Path(path).resolve()
-        cwd = Path.cwd()
-        try:
-            return str(p.relative_to(cwd))
-        except ValueError:
-            return str(p)
+        return CurvPaths._try_make_relative_to_dir(path, os.getcwd())
 
     def mk_rel_to_curv_root(self, path: str|Path) -> str:
         """
@@ -161,43 +253,43 @@ class CurvPaths(dict[str, CurvPath]):
         """
         return CurvPaths._try_make_relative_to_dir(path, self.get_config_dir())
 
-def get_curv_paths(ctx: Optional[Context] = None, curv_root_dir: Optional[str] = None, build_dir: Optional[str] = None) -> CurvPaths:
+def get_curv_paths(ctx: "Optional[Context]" = None, curv_root_dir: Optional[str] = None, build_dir: Optional[str] = None) -> CurvPaths:
     """
     Get the paths commonly used in this build system, and track where CURV_ROOT_DIR was obtained from.
     """
-    global curvpaths, _curvpaths_source
-
-    # initialize curvpaths if it's not already initialized
-    # (if we get called a second time with a non-None args, we re-initialize)
-    if curvpaths is None or ctx is not None or curv_root_dir is not None:
-        if ctx is not None and obj in ctx and ctx.obj is not None:
-            if not curv_root_dir:
-                curv_root_dir = ctx.obj.get("curv_root_dir", ctx.params.get("curv_root_dir", None))
-                _curvroot_dir_source = ctx.get_parameter_source("curv_root_dir")
-            if not build_dir:
-                build_dir = ctx.obj.get("build_dir", ctx.params.get("build_dir", None))
-                _build_dir_source = ctx.get_parameter_source("build_dir")
-
-        kwargs = {}
-        if curv_root_dir:
-            kwargs['curv_root_dir'] = curv_root_dir
-        if build_dir:
-            kwargs['build_dir'] = build_dir
-        if ctx is not None:
-            if 'obj' in ctx:
-                if 'profile' in ctx.obj and ctx.obj['profile'] is None:
-                    kwargs['profile'] = ctx.params.get("profile", None)
-                if 'board' in ctx.obj and ctx.obj['board'] is None:
-                    kwargs['board'] = ctx.params.get("board", None)
-                if 'device' in ctx.obj and ctx.obj['device'] is None:
-                    kwargs['device'] = ctx.params.get("device", None)
-            else:
-                kwargs['profile'] = ctx.params.get("profile", None)
-                kwargs['board'] = ctx.params.get("board", None)
-                kwargs['device'] = ctx.params.get("device", None)
-        if curvpaths is None:
-            curvpaths = CurvPaths(**kwargs)
-        else:
-            curvpaths.update_and_refresh(**kwargs)
+    global curvpaths, _curvroot_dir_source, _last_args_key
+
+    # fast path: no new inputs, so hand back the existing object
+    if curvpaths is not None and ctx is None and curv_root_dir is None and build_dir is None:
+        return curvpaths
+
+    kwargs = {}
+    if ctx is not None:
+        # ctx.obj is a CurvContext (or None); a value on it wins over the click param
+        obj = ctx.obj
+        params = ctx.params
+        if not curv_root_dir:
+            curv_root_dir = getattr(obj, "curv_root_dir", None) or params.get("curv_root_dir", None)
+            _curvroot_dir_source = ctx.get_parameter_source("curv_root_dir")
+        if not build_dir:
+            build_dir = getattr(obj, "build_dir", None) or params.get("build_dir", None)
+        for name in ("profile", "board", "device"):
+            if params.get(name, None) is not None:
+                kwargs[name] = params[name]
+    if curv_root_dir:
+        kwargs['curv_root_dir'] = curv_root_dir
+    if build_dir:
+        kwargs['build_dir'] = build_dir
+
+    # same inputs as last time: nothing to construct or refresh
+    args_key = tuple(sorted((k, os.fspath(v) if isinstance(v, Path) else v) for k, v in kwargs.items()))
+    if curvpaths is not None and args_key == _last_args_key:
+        return curvpaths
+    _last_args_key = args_key
+
+    if curvpaths is None:
+        curvpaths = CurvPaths(**kwargs)
+    else:
+        curvpaths.update_and_refresh(**kwargs)
 
     return curvpaths
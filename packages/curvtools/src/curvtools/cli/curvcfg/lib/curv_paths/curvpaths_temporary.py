@@ -7,8 +7,7 @@ def get_curv_root_dir_from_repo_root(repo_root_dir: Path|str, invert: bool = Fal
     If invert is True, it means we are trying to get the repo root from the CURV_ROOT_DIR,
     so we need to reverse the process and join with "../..".
     """
-    import os
     if invert:
-        return Path(os.path.join(repo_root_dir, "../..")).resolve()
+        return Path(repo_root_dir, "../..").resolve()
     else:
-        return Path(os.path.join(repo_root_dir, "my-designs/riscv-soc")).resolve()
\ No newline at end of file
+        return Path(repo_root_dir, "my-designs/riscv-soc").resolve()
\ No newline at end of file
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import re
-from pathlib import Path
-from typing import TYPE_CHECKING
+from graphlib import TopologicalSorter
+from typing import Optional
+
+_VAR_RE = re.compile(r'\$\((?P<var_name_parens>[^)]+)\)|\$\{(?P<var_name_braces>[^}]+)\}')
 
 def match_vars(s: str) -> list[tuple[str, tuple[int, int], str]]:
     """
@@ -15,9 +17,8 @@ def match_vars(s: str) -> list[tuple[str, tuple[int, int], str]]:
     Returns:
         A list of tuples containing the variable name, the span of the match, and the match itself.
     """
-    regex = re.compile(r'\$\((?P<var_name_parens>[^)]+)\)|\$\{(?P<var_name_braces>[^}]+)\}')
     vars_spans = []
-    for match in regex.finditer(s):
+    for match in _VAR_RE.finditer(s):
         var_name = match.group("var_name_parens") or match.group("var_name_braces")
         vars_spans.append((var_name, match.span(), s[match.start():match.end()]))
     return vars_spans or []
@@ -35,11 +36,40 @@ def replace_vars(s: str, vars: dict[str, str]) -> str:
         The string with the $(VAR_NAME) and ${VAR_NAME} patterns replaced with 
         the value of the variable if provided and not None.
     """
-    vars_spans = match_vars(s)
-    pos_delta = 0
-    for var_name, (start, end), match in vars_spans:
-        if vars is not None and var_name in vars and vars[var_name] is not None:
-            s = s[:start + pos_delta] + vars[var_name] + s[end + pos_delta:]
-            pos_delta += len(vars[var_name]) - len(match)
-    return s
+    if not vars:
+        return s
+    def _replace(match: re.Match) -> str:
+        value = vars.get(match.group("var_name_parens") or match.group("var_name_braces"))
+        return match.group(0) if value is None else value
+    return _VAR_RE.sub(_replace, s)
+
+def expand_vars_in_dependency_order(values: dict[str, Optional[str]]) -> dict[str, str]:
+    """
+    Expand $(VAR_NAME) and ${VAR_NAME} references between the entries of `values`.
+
+    Each value is expanded exactly once, after every entry it references has been expanded,
+    so chains like A=${B}/x, B=${C}/y cost O(V+E) instead of repeated re-substitution.
+    References to names that are not keys of `values` (or whose value is None) are left unchanged.
+
+    Args:
+        values: a dict[str, str|None] of variable names -> their raw (unexpanded) values
+
+    Returns:
+        A dict of variable names -> their fully expanded values (None values are dropped).
+
+    Raises:
+        graphlib.CycleError: if the references between entries form a cycle.
+    """
+    graph: dict[str, set[str]] = {}
+    for k, v in values.items():
+        if v is None:
+            continue
+        graph[k] = {
+            var_name for var_name, _, _ in match_vars(v)
+            if values.get(var_name) is not None
+        }
 
+    expanded: dict[str, str] = {}
+    for k in TopologicalSorter(graph).static_order():
+        expanded[k] = replace_vars(values[k], expanded)
+    return expanded
@@ -1,26 +1,22 @@
-from curvpyutils.file_utils import open_write_iff_change
+import os
+from curvpyutils.file_utils import write_iff_change
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
 
 
 __all__ = ["emit_dep_file"]
 
-def _replace_path_with_make_var(path: Path, curvpaths: CurvPaths) -> str:
+def _make_var_prefixes(curvpaths: CurvPaths) -> list[tuple[str, str]]:
     """
-    Replace the directory portion of an absolute path with the longest matching make variable
-    from curvpaths, keeping the filename visible for readability.
+    Collect (var_name, resolved_dir_path) for every fully resolved curvpaths entry, longest path first.
 
     Args:
-        path: the absolute path to transform (input Path)
         curvpaths: the curvpaths object (input CurvPaths) containing available make variables
 
     Returns:
-        The path with the longest matching prefix replaced by $(VAR_NAME), or the original 
-        path string if no match is found. The filename is always preserved.
+        The candidate make variable prefixes, sorted by path length (descending).
     """
-    path_str = str(path)
-    
     # Build a list of (var_name, resolved_dir_path) for all fully resolved entries
     # We only want directory paths, so we'll treat each resolved path as a potential directory prefix
     resolved_vars: list[tuple[str, str]] = []
@@ -33,48 +29,68 @@ def _replace_path_with_make_var(path: Path, curvpaths: CurvPaths) -> str:
     
     # Also add the base curvpaths attributes (curv_root_dir and build_dir) as they may not be in the dict
     if curvpaths.curv_root_dir is not None:
-        resolved_vars.append(('CURV_ROOT_DIR', str(curvpaths.curv_root_dir).rstrip('/')))
+        resolved_vars.append(('CURV_ROOT_DIR', curvpaths.get_curv_root_dir().rstrip('/')))
     if curvpaths.build_dir is not None:
-        resolved_vars.append(('BUILD_DIR', str(curvpaths.build_dir).rstrip('/')))
+        resolved_vars.append(('BUILD_DIR', os.fspath(curvpaths.build_dir).rstrip('/')))
     
     # Sort by path length (descending) so we find the longest match first
     resolved_vars.sort(key=lambda x: len(x[1]), reverse=True)
-    
-    # Get the directory portion of the path (everything except the filename)
-    path_dir = str(path.parent)
-    filename = path.name
-    
-    # Find the longest matching prefix for the directory portion
-    best_match_var = None
-    best_match_remainder = None
-    
+    return resolved_vars
+
+
+def _make_var_dir(path_dir: str, resolved_vars: list[tuple[str, str]]) -> Optional[str]:
+    """
+    Return `path_dir` with its longest matching make variable prefix replaced, e.g.
+    "$(CURV_ROOT_DIR)/schemas", or None if no variable matches.
+    """
     for var_name, var_path in resolved_vars:
         # Check if the directory portion starts with this variable's path
         if path_dir == var_path:
             # Exact match for the directory - this is the best case
-            best_match_var = var_name
-            best_match_remainder = ""
-            break
+            return f"$({var_name})"
         elif path_dir.startswith(var_path + '/'):
-            # The directory starts with this variable's path
-            remainder = path_dir[len(var_path):]  # Will start with '/'
-            best_match_var = var_name
-            best_match_remainder = remainder
-            break
-    
-    if best_match_var is not None:
-        if best_match_remainder:
-            return f"$({best_match_var}){best_match_remainder}/{filename}"
-        else:
-            return f"$({best_match_var})/{filename}"
+            # The directory starts with this variable's path; remainder starts with '/'
+            return f"$({var_name}){path_dir[len(var_path):]}"
+    return None
+
+
+def _replace_path_with_make_var(
+    path: Path, 
+    resolved_vars: list[tuple[str, str]], 
+    dir_memo: Optional[dict[str, Optional[str]]] = None,
+) -> str:
+    """
+    Replace the directory portion of an absolute path with the longest matching make variable,
+    keeping the filename visible for readability.
+
+    Args:
+        path: the absolute path to transform (input Path)
+        resolved_vars: the make variable prefixes from _make_var_prefixes()
+        dir_memo: optional cache of directory -> _make_var_dir() result, shared across
+            calls with the same resolved_vars
+
+    Returns:
+        The path with the longest matching prefix replaced by $(VAR_NAME), or the original 
+        path string if no match is found. The filename is always preserved.
+    """
+    # Get the directory portion of the path (everything except the filename)
+    path_dir = os.fspath(path.parent)
+    if dir_memo is None:
+        var_dir = _make_var_dir(path_dir, resolved_vars)
+    elif path_dir in dir_memo:
+        var_dir = dir_memo[path_dir]
     else:
+        var_dir = dir_memo[path_dir] = _make_var_dir(path_dir, resolved_vars)
+
+    if var_dir is None:
         # No match found, return the original path
-        return path_str
+        return os.fspath(path)
+    return f"{var_dir}/{path.name}"
 
 
 def emit_dep_file(
     target_path: Path, 
-    dependency_paths: list[Path], 
+    dependency_paths: Iterable[Path], 
 
     dep_file_out_path: Path, 
 
@@ -89,7 +105,7 @@ def emit_dep_file(
 
     Args:
         target_path: the path to the target file (input Path)
-        dependency_paths: the list of dependency paths (input list[Path])
+        dependency_paths: the dependency paths (input Iterable[Path]; iterated once)
         dep_file_out_path: the path to the output dependency file (input Path)
         curvpaths: the curvpaths object (input CurvPaths)
         header_comment: an optional header comment to add to the top of the dependency file (input str)
@@ -99,30 +115,30 @@ def emit_dep_file(
     Returns:
         True if the file was overwritten, False if it was not. (output bool)
     """
-    if not target_path or not dependency_paths or not dep_file_out_path or not curvpaths:
+    if not target_path or not dep_file_out_path or not curvpaths:
         raise ValueError("required arguments are missing")
 
-    target_path_str = _replace_path_with_make_var(target_path, curvpaths)
-    dep_paths_str_list = [_replace_path_with_make_var(p, curvpaths) for p in dependency_paths]
+    # the candidate prefixes are the same for every path, so collect and sort them once
+    resolved_vars = _make_var_prefixes(curvpaths)
+    # dependencies tend to share a few directories (schemas, profiles, overlays), so
+    # each directory's prefix scan is done once
+    dir_memo: dict[str, Optional[str]] = {}
+    target_path_str = _replace_path_with_make_var(target_path, resolved_vars, dir_memo)
+    dep_paths_str_list = [_replace_path_with_make_var(p, resolved_vars, dir_memo) for p in dependency_paths]
+    if not dep_paths_str_list:
+        raise ValueError("required arguments are missing")
 
-    s = """
+    parts = ["""
 # Machine-generated file; do not edit
-"""
+"""]
     if header_comment:
-        s += f"\n# {header_comment}\n"
-
-    s += "\n"
-    s += f"{target_path_str}: \\\n"
-    for i, p in enumerate(dep_paths_str_list):
-        is_last = i == len(dep_paths_str_list) - 1
-        if is_last:
-            s += f"  {p}\n"
-        else:
-            s += f"  {p} \\\n"
-
-    cm = open_write_iff_change(dep_file_out_path, "w", force_overwrite=not write_only_if_changed)
-    with cm as f:
-        f.write(s)
-        f.write("\n\n")
-
-    return bool(cm.changed)
+        parts.append(f"\n# {header_comment}\n")
+
+    parts.append("\n")
+    # the indent rides on the separator, so the dep list is joined in one pass
+    # without building an "  {p}" string per path
+    parts.append(f"{target_path_str}: \\\n  ")
+    parts.append(" \\\n  ".join(dep_paths_str_list))
+    parts.append("\n\n\n")
+
+    return write_iff_change(dep_file_out_path, parts, force_overwrite=not write_only_if_changed)
@@ -1,9 +1,11 @@
 from __future__ import annotations
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Callable, Tuple
+from typing import Optional, Callable, Dict, List, Tuple
 
-from curvpyutils.file_utils import open_write_iff_change
+from curvpyutils.file_utils import write_iff_change
 from curvtools.cli.curvcfg.lib.util.config_parsing import SchemaOracle
+from curvtools.cli.curvcfg.lib.util.config_parsing.parse_schema import SchemaBaseVar
 from curvtools.cli.curvcfg.lib.util.config_parsing.util.types import Artifact
 from curvtools.cli.curvcfg.lib.util.config_parsing.util.helpers import render_template_to_str
 
@@ -11,6 +13,22 @@ __all__ = [
     "emit_artifacts",
 ]
 
+# name-sorted (var_name, var) pairs selected for one artifact
+_SortedVars = List[Tuple[str, SchemaBaseVar]]
+
+_EMITTED_ARTIFACTS = (Artifact.SVPKG, Artifact.SVH, Artifact.ENV, Artifact.MK)
+
+_HASH_BANNER = (
+    "# -----------------------------------------------------------------------------\n"
+    "# Autogenerated by curvcfg. Do not edit.\n"
+    "# -----------------------------------------------------------------------------\n\n"
+)
+_SLASH_BANNER = (
+    "// -----------------------------------------------------------------------------\n"
+    "// Autogenerated by curvcfg. Do not edit.\n"
+    "// -----------------------------------------------------------------------------\n\n"
+)
+
 def emit_artifacts(
     schema_oracle: SchemaOracle,
     svpkg_out_path: Path,
@@ -21,6 +39,8 @@ def emit_artifacts(
     svh_template: Optional[Path] = None,
     mk_template: Optional[Path] = None,
     env_template: Optional[Path] = None,
+    *,
+    parallel: bool = False,
 ) -> Tuple[bool, bool, bool, bool]:
     """
     Emits the artifacts based on `schema_oracle`, e.g., for cfgvars:
@@ -41,6 +61,9 @@ def emit_artifacts(
         svh_template: optional template override for the SystemVerilog include file.
         mk_template: optional template override for the make fragment.
         env_template: optional template override for the environment file.
+        parallel: render and write the four outputs on a thread pool. Off by default:
+            the outputs are a few KB each, so the pool usually costs more than it saves;
+            it pays off with large schemas or slow (e.g. network) filesystems.
 
     Returns:
         A tuple of 4 bools indicating whether each output file was modified:
@@ -53,145 +76,142 @@ def emit_artifacts(
         print(f"Error: unresolved schema variables: {missing}")
         return (False, False, False, False)
 
-    for p in (svpkg_out_path, svh_out_path, env_out_path, mk_out_path):
-        p.parent.mkdir(parents=True, exist_ok=True)
-
-    svpkg_changed = _emit_one(
-        artifact=Artifact.SVPKG,
-        schema_oracle=schema_oracle,
-        out_path=svpkg_out_path,
-        template_path=svpkg_template,
-        render_fn=_emit_sv_pkg,
-    )
-    svh_changed = _emit_one(
-        artifact=Artifact.SVH,
-        schema_oracle=schema_oracle,
-        out_path=svh_out_path,
-        template_path=svh_template,
-        render_fn=_emit_svh_defines,
-    )
-    env_changed = _emit_one(
-        artifact=Artifact.ENV,
-        schema_oracle=schema_oracle,
-        out_path=env_out_path,
-        template_path=env_template,
-        render_fn=_emit_env_file,
+    # accept str paths too; the emitters rely on .name/.stem
+    svpkg_out_path, svh_out_path, env_out_path, mk_out_path = (
+        Path(p) for p in (svpkg_out_path, svh_out_path, env_out_path, mk_out_path)
     )
-    mk_changed = _emit_one(
-        artifact=Artifact.MK,
-        schema_oracle=schema_oracle,
-        out_path=mk_out_path,
-        template_path=mk_template,
-        render_fn=_emit_makefile,
+    # the outputs usually share one directory, so mkdir each distinct parent once
+    for parent in {p.parent for p in (svpkg_out_path, svh_out_path, env_out_path, mk_out_path)}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    vars_by_artifact = _sorted_vars_by_artifact(schema_oracle)
+
+    # (artifact, output path, template override, built-in emitter), in return order
+    jobs = (
+        (Artifact.SVPKG, svpkg_out_path, svpkg_template, _emit_sv_pkg),
+        (Artifact.SVH, svh_out_path, svh_template, _emit_svh_defines),
+        (Artifact.ENV, env_out_path, env_template, _emit_env_file),
+        (Artifact.MK, mk_out_path, mk_template, _emit_makefile),
     )
 
+    def run(job) -> bool:
+        artifact, out_path, template_path, render_fn = job
+        return _emit_one(
+            artifact=artifact,
+            schema_oracle=schema_oracle,
+            sorted_vars=vars_by_artifact[artifact],
+            out_path=out_path,
+            template_path=template_path,
+            render_fn=render_fn,
+        )
+
+    if parallel:
+        # the jobs share no output files; map() keeps results in job order
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+            svpkg_changed, svh_changed, env_changed, mk_changed = ex.map(run, jobs)
+    else:
+        svpkg_changed, svh_changed, env_changed, mk_changed = map(run, jobs)
+
     return (svpkg_changed, svh_changed, env_changed, mk_changed)
 
 
+def _sorted_vars_by_artifact(schema_oracle: SchemaOracle) -> Dict[Artifact, _SortedVars]:
+    """
+    Bucket the oracle's variables per emitted artifact in a single name-sorted
+    pass, rather than each emitter filtering the whole oracle and sorting again.
+    """
+    buckets: Dict[Artifact, _SortedVars] = {artifact: [] for artifact in _EMITTED_ARTIFACTS}
+    for name, var in sorted(schema_oracle.items(), key=itemgetter(0)):
+        # the set form, so an artifact listed twice still emits the var once
+        for artifact in getattr(var, "_artifact_set", ()):
+            bucket = buckets.get(artifact)
+            if bucket is not None:
+                bucket.append((name, var))
+    return buckets
+
+
+def _include_guard(out_path: Path) -> str:
+    """e.g. curv.mk -> __CURV_MK__, curvcfg.svh -> __CURVCFG_SVH__"""
+    return f"__{out_path.name.replace('.', '_').upper()}__"
+
+
 def _emit_one(
     artifact: Artifact,
     schema_oracle: SchemaOracle,
+    sorted_vars: _SortedVars,
     out_path: Path,
     template_path: Optional[Path],
-    render_fn: Callable[[SchemaOracle, Path], bool],
+    render_fn: Callable[[_SortedVars, Path], bool],
 ) -> bool:
     if template_path is not None:
         rendered = render_template_to_str(template_path, schema_oracle)
-        cm = open_write_iff_change(out_path, "w")
-        with cm as f:
-            f.write(rendered)
-        return cm.changed or False
+        return write_iff_change(out_path, rendered)
 
-    return render_fn(schema_oracle, out_path)
+    return render_fn(sorted_vars, out_path)
 
+# Each emitter accumulates its lines in a list and hands them to write_iff_change
+# in one call, rather than issuing a buffered write per line.
 
-def _emit_makefile(schema_oracle: SchemaOracle, out_path: Path) -> bool:
-    guard_name = f"__{out_path.name.replace('.', '_').upper()}__"
-    vars_for_mk = schema_oracle.get_vars_for_artifact(Artifact.MK)
+def _emit_makefile(vars_for_mk: _SortedVars, out_path: Path) -> bool:
+    guard_name = _include_guard(out_path)
 
     # Calculate longest name for alignment
-    longest_name = max(len(name) for name in vars_for_mk.keys()) if vars_for_mk else 0
-
-    cm = open_write_iff_change(out_path, "w")
-    with cm as f:
-        f.write(f"ifndef {guard_name}\n")
-        f.write(f"{guard_name} := 1\n\n")
-        f.write("# Autogenerated by curvcfg. Do not edit.\n")
-        for name in sorted(vars_for_mk.keys()):
-            var = vars_for_mk[name]
-            padded_name = name.ljust(longest_name)
-            f.write(f"{padded_name} := {var.mk_display()}\n")
-        f.write("\n")
-        f.write(f"endif # {guard_name}\n")
-    return cm.changed or False
+    longest_name = max((len(name) for name, _ in vars_for_mk), default=0)
 
+    parts = [
+        f"ifndef {guard_name}\n",
+        f"{guard_name} := 1\n\n",
+        "# Autogenerated by curvcfg. Do not edit.\n",
+    ]
+    parts.extend(f"{name.ljust(longest_name)} := {var.mk_display()}\n" for name, var in vars_for_mk)
+    parts.append(f"\nendif # {guard_name}\n")
+    return write_iff_change(out_path, parts)
 
-def _emit_env_file(schema_oracle: SchemaOracle, out_path: Path) -> bool:
-    vars_for_env = schema_oracle.get_vars_for_artifact(Artifact.ENV)
 
+def _emit_env_file(vars_for_env: _SortedVars, out_path: Path) -> bool:
     # Calculate longest name for alignment
-    longest_name = max(len(name) for name in vars_for_env.keys()) if vars_for_env else 0
-
-    cm = open_write_iff_change(out_path, "w")
-    with cm as f:
-        f.write("# -----------------------------------------------------------------------------\n")
-        f.write("# Autogenerated by curvcfg. Do not edit.\n")
-        f.write("# -----------------------------------------------------------------------------\n\n")
-        for name in sorted(vars_for_env.keys()):
-            var = vars_for_env[name]
-            padded_name = name.ljust(longest_name)
-            f.write(f"{padded_name} = {var.mk_display()}\n")
-    return cm.changed or False
-
-
-def _emit_svh_defines(schema_oracle: SchemaOracle, out_path: Path) -> bool:
-    vars_for_svh = schema_oracle.get_vars_for_artifact(Artifact.SVH)
-    filename = out_path.name.upper().replace(".", "_")
-    guard = f"__{filename}__"
-
-    cm = open_write_iff_change(out_path, "w")
-    with cm as f:
-        f.write("// -----------------------------------------------------------------------------\n")
-        f.write("// Autogenerated by curvcfg. Do not edit.\n")
-        f.write("// -----------------------------------------------------------------------------\n\n")
-        f.write(f"`ifndef {guard}\n`define {guard}\n\n")
-
-        if not vars_for_svh:
-            f.write("// (No defines selected by schema locations)\n")
-        else:
-            longest = max(len(k) for k in vars_for_svh.keys())
-            for name in sorted(vars_for_svh.keys()):
-                var = vars_for_svh[name]
-                lit = var.sv_literal(for_macro=True)
-                padding = name.ljust(longest + 4)
-                f.write(f"`define {padding} {lit}\n")
-
-        f.write(f"\n`endif // {guard}\n")
-    return cm.changed or False
-
-
-def _emit_sv_pkg(schema_oracle: SchemaOracle, out_path: Path) -> bool:
-    vars_for_pkg = schema_oracle.get_vars_for_artifact(Artifact.SVPKG)
+    longest_name = max((len(name) for name, _ in vars_for_env), default=0)
+
+    parts = [_HASH_BANNER]
+    parts.extend(f"{name.ljust(longest_name)} = {var.mk_display()}\n" for name, var in vars_for_env)
+    return write_iff_change(out_path, parts)
+
+
+def _emit_svh_defines(vars_for_svh: _SortedVars, out_path: Path) -> bool:
+    guard = _include_guard(out_path)
+
+    parts = [_SLASH_BANNER, f"`ifndef {guard}\n`define {guard}\n\n"]
+    if not vars_for_svh:
+        parts.append("// (No defines selected by schema locations)\n")
+    else:
+        longest = max(len(name) for name, _ in vars_for_svh)
+        parts.extend(
+            f"`define {name.ljust(longest + 4)} {var.sv_literal(for_macro=True)}\n"
+            for name, var in vars_for_svh
+        )
+    parts.append(f"\n`endif // {guard}\n")
+    return write_iff_change(out_path, parts)
+
+
+def _emit_sv_pkg(vars_for_pkg: _SortedVars, out_path: Path) -> bool:
     pkg_name = out_path.stem.lower()
 
-    cm = open_write_iff_change(out_path, "w")
-    with cm as f:
-        f.write("// -----------------------------------------------------------------------------\n")
-        f.write("// Autogenerated by curvcfg. Do not edit.\n")
-        f.write("// -----------------------------------------------------------------------------\n\n")
-        f.write(f"package {pkg_name};\n\n")
-        f.write("  // verilator lint_off UNUSEDPARAM\n")
-
-        # Calculate max prefix length (type + space + name) for alignment
-        max_prefix_len = max((var.sv_prefix_length() for var in vars_for_pkg.values()), default=0)
-
-        for name in sorted(vars_for_pkg.keys()):
-            var = vars_for_pkg[name]
-            line = var.sv_display(align_to=max_prefix_len)
-            if not line.strip().endswith(";"):
-                line = line.rstrip() + ";"
-            f.write(f"  {line}\n")
-
-        f.write("  // verilator lint_on UNUSEDPARAM\n\n")
-        f.write(f"endpackage : {pkg_name}\n")
-    return cm.changed or False
+    parts = [
+        _SLASH_BANNER,
+        f"package {pkg_name};\n\n",
+        "  // verilator lint_off UNUSEDPARAM\n",
+    ]
+
+    # Calculate max prefix length (type + space + name) for alignment
+    max_prefix_len = max((var.sv_prefix_length() for _, var in vars_for_pkg), default=0)
+
+    for _, var in vars_for_pkg:
+        line = var.sv_display(align_to=max_prefix_len)
+        if not line.strip().endswith(";"):
+            line = line.rstrip() + ";"
+        parts.append(f"  {line}\n")
+
+    parts.append("  // verilator lint_on UNUSEDPARAM\n\n")
+    parts.append(f"endpackage : {pkg_name}\n")
+    return write_iff_change(out_path, parts)
@@ -1,13 +1,37 @@
 from __future__ import annotations
+import itertools
 from pathlib import Path
 from typing import Optional, Any
 from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
 from curvtools.cli.curvcfg.lib.util.artifact_emitter import emit_dep_file
 import curvpyutils.tomlrw as tomlrw
-from curvpyutils.file_utils import open_write_iff_change
+from curvpyutils.file_utils import write_iff_change
 
 __all__ = ["emit_merged_toml_and_dep_file"]
 
+_GENERAL_HEADER_COMMENT = """\
+########################################################
+# Machine-generated file; do not edit
+########################################################
+"""
+_SCHEMA_HEADER_COMMENT = """
+########################################################
+#
+# Schema section
+#
+########################################################
+
+"""
+_MERGED_CONFIG_HEADER_COMMENT = """
+########################################################
+#
+# Configuration section
+#
+########################################################
+
+"""
+
+
 def emit_merged_toml_and_dep_file(
         curvpaths: CurvPaths,
 
@@ -46,46 +70,19 @@ def emit_merged_toml_and_dep_file(
             and True if the dep file was overwritten, False if it was not.
     """
 
-    general_header_comment = """\
-########################################################
-# Machine-generated file; do not edit
-########################################################
-"""
-    schema_header_comment = """
-########################################################
-#
-# Schema section
-#
-########################################################
-
-"""
-    merged_config_header_comment = """
-########################################################
-#
-# Configuration section
-#
-########################################################
-
-"""
-
-    # Build the content as a string, canonicalizing each TOML section
+    # Build the content section by section, canonicalizing each TOML section
     parts = []
     if header_comment and header_comment.strip():
         parts.append('# ' + header_comment.strip("\n") + '\n\n')
-    parts.append(general_header_comment)
-    parts.append(merged_config_header_comment)
+    parts.append(_GENERAL_HEADER_COMMENT)
+    parts.append(_MERGED_CONFIG_HEADER_COMMENT)
     parts.append(tomlrw.dumps(merged_config, should_canonicalize=True))
-    parts.append(schema_header_comment)
+    parts.append(_SCHEMA_HEADER_COMMENT)
     parts.append(tomlrw.dumps(combined_schema, should_canonicalize=True))
     parts.append('\n')
 
-    content = "".join(parts)
-
-    cm = open_write_iff_change(merged_toml_out_path, "w", force_overwrite=not overwrite_only_if_changed)
-    with cm as f:
-        f.write(content)
-
-    merged_toml_overwritten = bool(cm.changed)
+    # write_iff_change joins the sections into one buffer for the compare and the write
+    merged_toml_overwritten = write_iff_change(merged_toml_out_path, parts, force_overwrite=not overwrite_only_if_changed)
     dep_file_overwritten = False
 
     # if mk_dep_out_path is not provided, we don't
@@ -93,7 +90,7 @@ def emit_merged_toml_and_dep_file(
     if mk_dep_out_path is not None:
         dep_file_overwritten = emit_dep_file(
             target_path=merged_toml_out_path,
-            dependency_paths=schema_src_paths + config_src_paths,
+            dependency_paths=itertools.chain(schema_src_paths, config_src_paths),
             dep_file_out_path=mk_dep_out_path,
             curvpaths=curvpaths,
             header_comment=header_comment,
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Mapping, Optional
 
 import curvpyutils.tomlrw as tomlrw
 
 from .parse_schema import parse_dict_to_schema_vars, SchemaOracle, SCHEMA_ROOT_KEY
 
 
-def schema_oracle_from_merged_toml(merged_toml: Path) -> SchemaOracle:
+def schema_oracle_from_merged_toml(merged_toml: Path, merged_dict: Optional[Mapping[str, Any]] = None) -> SchemaOracle:
     """
     Build a SchemaOracle from a merged TOML file.
+
+    `merged_dict` is the already-loaded contents of `merged_toml`, if the caller has them;
+    otherwise the file is parsed here.
     """
-    merged_dict: Mapping[str, Any] = tomlrw.loadf(merged_toml)
+    if merged_dict is None:
+        merged_dict = tomlrw.loadf(merged_toml)
 
     schema_dict = parse_dict_to_schema_vars(merged_dict, merged_toml)
     schema_oracle = SchemaOracle(vars_by_name=schema_dict)
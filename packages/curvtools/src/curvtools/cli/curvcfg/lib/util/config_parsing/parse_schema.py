@@ -1,22 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+import functools
 import re
-import sys
-import tempfile
-import os
-from rich import print as rprint
 from pathlib import Path
-import curvpyutils.tomlrw as tomlrw
 from curvtools.cli.curvcfg.lib.util.config_parsing.util import ( 
     Artifact, 
     ValueSource, 
     ParseType, 
     _Domain, 
-    DomainChoices, 
-    DomainRange, 
     _get_domain_and_src_generic, 
     _parse_artifacts, 
     _lookup_dotted
@@ -35,6 +27,59 @@ SCHEMA_ROOT_KEY = "_schema"
 VARS_KEY = "vars"
 ARRAYS_KEY = "arrays"
 
+# "[msb:lsb]" in a display.sv type such as "logic [31:0]"
+_SV_RANGE_RE = re.compile(r"\[(\d+)\s*:\s*(\d+)\]")
+
+@functools.lru_cache(maxsize=None)
+def _sv_type_traits(sv_type: str) -> Tuple[Optional[Callable[[int], str]], bool]:
+    """
+    Classify a (stripped, non-empty) display.sv type for sv_literal().
+
+    Returns (int formatter or None if not a bit-vector, is_string_type). The formatter
+    has the width prefix, mask and hex format spec baked in, e.g. for "logic [31:0]"
+    it maps -4 -> "32'hfffffffc". Many variables share a handful of types, so each
+    one is classified only once.
+    """
+    is_string = "string" in sv_type.lower()
+    m = _SV_RANGE_RE.search(sv_type)
+    if not m:
+        return None, is_string
+    width = abs(int(m.group(1)) - int(m.group(2))) + 1
+    prefix = f"{width}'h"
+    spec = f"0{(width + 3) // 4}x"
+    mask = (1 << width) - 1  # 2's complement masking for negative values
+
+    # memoized per value: the SVH and SV package emitters format the same values,
+    # and small values (0, 1, enum codes) recur across variables of one type
+    @functools.lru_cache(maxsize=1024)
+    def fmt(v: int) -> str:
+        return prefix + format(v & mask, spec)
+
+    return fmt, is_string
+
+@functools.lru_cache(maxsize=None)
+def _mk_formatter(display_mk: str) -> Callable[[Any], str]:
+    """
+    Return the mk_display() formatter for a display.mk string, with the
+    template/int/string decision made once per distinct display.mk.
+    """
+    mk = display_mk.strip()
+    if "{" in mk and "}" in mk:
+        template = mk.format
+
+        def fmt(v: Any) -> str:
+            try:
+                return template(value=v)
+            except Exception:
+                # fall back to plain str(), as for an unknown keyword
+                return str(v)
+
+        return fmt
+    if mk == "int" or mk == "uint":
+        return lambda v: str(int(v))
+    # "string", empty, and any other keyword
+    return str
+
 # ---------------------------------------------------------------------------
 # Base class
 # ---------------------------------------------------------------------------
@@ -158,7 +203,7 @@ class SchemaObjectArrayVar(SchemaBaseVar):
     Each element is { field_name : value }.
     """
 
-    __slots__ = ("toml_path", "arrayvars", "vars", "elements", "array_metadata", "artifacts")
+    __slots__ = ("toml_path", "arrayvars", "vars", "elements", "array_metadata", "artifacts", "_artifact_set")
 
     def __init__(
         self,
@@ -175,6 +220,7 @@ class SchemaObjectArrayVar(SchemaBaseVar):
         self.arrayvars = arrayvars
         self.vars = vars
         self.artifacts = list(artifacts)
+        self._artifact_set = frozenset(self.artifacts)  # membership tests by the oracle/emitters
         self.elements: List[Dict[str, Any]] = []
         self.array_metadata: Dict[str, Any] = {}
     
@@ -348,10 +394,13 @@ class SchemaScalarVar(SchemaBaseVar):
         "_parse_type",
         "_domain",
         "_display_sv",
+        "_sv_type",
         "_display_mk",
         "artifacts",
+        "_artifact_set",
         "value",
         "value_source",
+        "_mk_display_cache",
     )
 
     def __init__(
@@ -375,10 +424,15 @@ class SchemaScalarVar(SchemaBaseVar):
         self._parse_type = ParseType(parse_type)
         self._domain = domain
         self._display_sv = display_sv or ""
+        self._sv_type = self._display_sv.strip()  # stripped once for the sv_* helpers
         self._display_mk = display_mk or ""
         self.artifacts = list(artifacts)
+        self._artifact_set = frozenset(self.artifacts)  # membership tests by the oracle/emitters
         self.value: Any = None  # set by parse()
         self.value_source = value_source
+        # (value, mk_display() text) for the last formatted self.value; keyed on the value's
+        # identity so a later parse() invalidates it without any bookkeeping
+        self._mk_display_cache: Optional[Tuple[Any, str]] = None
     @classmethod
     def from_constant_value(
         cls, 
@@ -518,23 +572,15 @@ class SchemaScalarVar(SchemaBaseVar):
         - Fallback returns str(value).
         """
         v = self._ensure_value()
-        sv_type = self._display_sv.strip()
+        sv_type = self._sv_type
         if not sv_type:
             return str(v)
 
-        m = re.search(r"\[(\d+)\s*:\s*(\d+)\]", sv_type)
-        if m and isinstance(v, int):
-            msb = int(m.group(1))
-            lsb = int(m.group(2))
-            width = abs(msb - lsb) + 1
-            hex_digits = (width + 3) // 4
-
-            mask = (1 << width) - 1
-            vv = v & mask
+        int_fmt, is_string_type = _sv_type_traits(sv_type)
+        if int_fmt is not None and isinstance(v, int):
+            return int_fmt(v)
 
-            return f"{width}'h{vv:0{hex_digits}x}"
-
-        if "string" in sv_type.lower() or isinstance(v, str):
+        if is_string_type or isinstance(v, str):
             if for_macro:
                 return f'`"{v}`"'
             return f'"{v}"'
@@ -543,7 +589,7 @@ class SchemaScalarVar(SchemaBaseVar):
 
     def sv_prefix_length(self) -> int:
         """Return the length of 'sv_type + space + var_name' for alignment calculations."""
-        sv_type = self._display_sv.strip()
+        sv_type = self._sv_type
         if not sv_type:
             return 0
         return len(sv_type) + 1 + len(self.var_name)
@@ -564,7 +610,7 @@ class SchemaScalarVar(SchemaBaseVar):
             display.sv containing "string" ->
                 "localparam string CFG_... = \"asm\";"
         """
-        sv_type = self._display_sv.strip()
+        sv_type = self._sv_type
         if not sv_type:
             return str(self._ensure_value())
 
@@ -592,29 +638,18 @@ class SchemaScalarVar(SchemaBaseVar):
                 "string" -> str(...)
             - Fallback: str(v)
         """
-        if value is None:
-            v = self._ensure_value()
-        else:
+        if value is not None:
             # Coerce the provided value to ensure it's the right type
-            v = self._coerce(value)
-        
-        mk = self._display_mk.strip()
-        if not mk:
-            return str(v)
+            return _mk_formatter(self._display_mk)(self._coerce(value))
 
-        if "{" in mk and "}" in mk:
-            try:
-                return mk.format(value=v)
-            except Exception:
-                # fall through to simple handling
-                pass
-
-        if mk == "int" or mk == "uint":
-            return str(int(v))
-        elif mk == "string":
-            return str(v)
-        else:
-            return str(v)
+        # the MK and ENV emitters (and the merged-TOML table) all ask for the same text
+        v = self._ensure_value()
+        cached = self._mk_display_cache
+        if cached is not None and cached[0] is v:
+            return cached[1]
+        text = _mk_formatter(self._display_mk)(v)
+        self._mk_display_cache = (v, text)
+        return text
 
     def __repr__(self) -> str:
         from_str = "constant_value" if self.value_source == ValueSource.CONSTANT else f"{self.schema_filepath.as_posix()}@{self.toml_path}"
@@ -735,7 +770,7 @@ class SchemaOracle(Mapping[str, SchemaBaseVar]):
         out: Dict[str, Any] = {}
 
         for name, var in self._by_name.items():
-            var_artifacts = getattr(var, "artifacts", [])
+            var_artifacts = getattr(var, "_artifact_set", ())
             if artifact not in var_artifacts:
                 continue
 
@@ -758,7 +793,7 @@ class SchemaOracle(Mapping[str, SchemaBaseVar]):
         """
         return {
             name: var
-            for name, var in self._by_name.items() if artifact in getattr(var, "artifacts", [])
+            for name, var in self._by_name.items() if artifact in getattr(var, "_artifact_set", ())
         }
 
 def parse_dict_to_schema_vars(data: dict[str, Any], schema_filepath: Path) -> Dict[str, SchemaBaseVar]:
@@ -1,35 +1,98 @@
 from __future__ import annotations
-from typing import Union, Optional, Dict, List
-from rich.padding import Padding, PaddingDimensions
-from rich.panel import Panel
-from rich.box import Box, ASCII_DOUBLE_HEAD, ROUNDED, ASCII2, SIMPLE, MINIMAL_DOUBLE_HEAD, MINIMAL, MINIMAL_HEAVY_HEAD
-from rich.style import Style
+import functools
+from os import fspath
+from typing import Optional, Iterator
+from rich.box import Box, ROUNDED, ASCII2, MINIMAL_HEAVY_HEAD
 from rich.table import Table
-from rich.markup import escape
-from rich.tree import Tree
+from rich.console import Group, RenderableType
 from rich.text import Text
 from pathlib import Path
 from curvtools.cli.curvcfg.lib.globals.console import console
-import click
-from curvtools.cli.curvcfg.cli_helpers.opts.fs_path_opt import FsPathType
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
+    from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths, CurvContext
+    from curvtools.cli.curvcfg.cli_helpers.opts.fs_path_opt import FsPathType
 from curvtools.cli.curvcfg.lib.globals.constants import PATHS_RAW_ENV_FILE_REL_PATH
 from curvtools.cli.curvcfg.lib.util.config_parsing import SchemaOracle
 from curvtools.cli.curvcfg.lib.util.config_parsing.parse_schema import SchemaScalarVar
 
+# renderables queued by the display_* helpers; flush_tables() prints them all at once
+_pending: list[RenderableType] = []
+_BLANK_LINE = Text()
+
+# style per makefile type; "_"-prefixed entries are fixed colors, not types
+_MAKEFILE_TYPE_STYLES: dict[str, str] = {
+    "int": "yellow",
+    "uint": "bold red",
+    "string": "bold white",
+    "default": "bold green",
+    "_magenta": "magenta2",
+    "_blue": "blue",
+}
+_DEFAULT_STYLE = _MAKEFILE_TYPE_STYLES["default"]
+
+def _colorize_key(s: str, toml_path: Any, style: str = "bold yellow") -> Text:
+    return Text.assemble((s, style), f"\n{toml_path}")
+
+# values (0/1, enum labels, type names) repeat a lot across rows; Text cells skip
+# rich's markup parsing, and rendering never mutates them, so they can be shared
+@functools.lru_cache(maxsize=4096)
+def _colorize_value(makefile_type: Optional[str], s: str) -> Text:
+    return Text(s, style=_MAKEFILE_TYPE_STYLES.get(makefile_type, _DEFAULT_STYLE))
+
+# most variables share one of a handful of artifact sets, so the joined
+# "Locations" string is built once per set
+@functools.lru_cache(maxsize=256)
+def _join_artifacts(artifacts: tuple[str, ...]) -> str:
+    return ", ".join(artifacts)
+
+# table titles without a source line never change, so they are built once
+_VARIABLE_VALUES_TITLE = Text("Variable Values", style="bold white")
+_TOOL_SETTINGS_TITLE = Text("Tool Settings", style="bold white")
+
+def _title_with_source(label: str, source_path: Any) -> Text:
+    return Text.assemble(
+        Text(f"{label}\n", style="bold white"),
+        Text("(source: "),
+        Text(f"{source_path}", style="bold green"),
+        Text(")")
+    )
+
+_RESOLVED_YES = "[green]yes[/green]"
+_RESOLVED_NO = "[red]no[/red]"
+
+# indexed by use_ascii_box (False -> 0, True -> 1)
+_BOXES = (ROUNDED, ASCII2)
+_HEAD_BOXES = (MINIMAL_HEAVY_HEAD, ASCII2)
+
 def get_box(use_ascii_box: bool = False) -> Box:
-    return ASCII2 if use_ascii_box else ROUNDED
+    return _BOXES[bool(use_ascii_box)]
+
+def _queue(renderable: RenderableType) -> None:
+    # queue a renderable followed by its blank spacer line; the spacer is a
+    # prebuilt Text so Group doesn't route a "" through console.render_str()
+    _pending.append(renderable)
+    _pending.append(_BLANK_LINE)
+
+def flush_tables() -> None:
+    """
+    Print everything queued by the display_* helpers with a single console.print() call.
 
-def _extract_variable_info(schema_oracle: SchemaOracle) -> list[dict[str, Any]]:
+    Call this once after a run of display_* calls, before printing anything else.
+    """
+    if _pending:
+        console.print(Group(*_pending))
+        _pending.clear()
+
+def _extract_variable_info(schema_oracle: SchemaOracle) -> Iterator[dict[str, Any]]:
     """
     Iterate over all variables in a SchemaOracle and extract their metadata.
     
-    Returns a list of dicts, one per variable, with the following structure:
+    Yields one dict per variable (lazily, so rows can be added as they are produced),
+    with the following structure:
     {
         'var_name': str,               # e.g., 'CFG_CACHE_CACHELINES_LATENCY'
-        'artifacts': list[str],        # e.g., ['SVPKG', 'MK', 'ENV', 'SVH']
+        'artifacts': tuple[str, ...],  # e.g., ('SVPKG', 'MK', 'ENV', 'SVH')
         'display_mk': str,             # e.g., 'int'
         'display_sv': str,             # e.g., 'int'
         'domain_kind': str,            # 'none', 'choices', or 'range'
@@ -43,16 +106,14 @@ def _extract_variable_info(schema_oracle: SchemaOracle) -> list[dict[str, Any]]:
         'toml_path': str | None,       # e.g., 'cache.cachelines.latency'
     }
     """
-    results = []
-    
     # Iterate over all variables in the SchemaOracle
     for var_name, var in schema_oracle.items():
         # Only process scalar variables (skip array variables for this example)
         if not isinstance(var, SchemaScalarVar):
             continue
         
-        # Extract artifacts list (convert Artifact enum to string)
-        artifacts = [artifact.value for artifact in var.artifacts]
+        # Extract artifacts (convert Artifact enum to string); a tuple so it can key _join_artifacts
+        artifacts = tuple(artifact.value for artifact in var.artifacts)
         
         # Extract display information
         display_mk = var._display_mk  # e.g., 'int'
@@ -98,8 +159,7 @@ def _extract_variable_info(schema_oracle: SchemaOracle) -> list[dict[str, Any]]:
             'toml_path': toml_path,
             'value': var.mk_display() if var._display_mk is not None else None
         }
-        results.append(var_info)
-    return results
+        yield var_info
 
 def display_merged_toml_table(
     schema_oracle: SchemaOracle, 
@@ -118,74 +178,60 @@ def display_merged_toml_table(
     Returns:
         None
     """
-    # Color helpers
-    def get_color_for_makefile_type(makefile_type: str | None) -> dict[str, str]:
-        color_for_makefile_type = {
-            "int": {"open": "[yellow]", "close": "[/yellow]"},
-            "uint": {"open": "[bold red]", "close": "[/bold red]"},
-            "string": {"open": "[bold white]", "close": "[/bold white]"},
-            "default": {"open": "[bold green]", "close": "[/bold green]"},
-            "_magenta": {"open": "[magenta2]", "close": "[/magenta2]"},
-            "_blue": {"open": "[blue]", "close": "[/blue]"},
-        }
-        if makefile_type is not None and makefile_type in color_for_makefile_type:
-            return color_for_makefile_type[makefile_type]
-        return color_for_makefile_type["default"]
-    def colorize_key(s: str, color: str = "bold yellow") -> str:
-        return f"[{color}]" + s + f"[/{color}]"
-    def colorize_value(makefile_type: str, s: str) -> str:
-        m = get_color_for_makefile_type(makefile_type)
-        return m["open"] + s + m["close"]
-
-    from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
     table_options = {}
-    table_options["box"] = get_box(use_ascii_box)
-    TitleWithSourceText = Text.assemble(
-        Text("Variable Values\n", style="bold white"),
-        Text("(source: "),
-        Text(f"{merged_toml_path}", style="bold green"),
-        Text(")")
-    )
-    TitleText = Text("Variable Values", style="bold white")
-
+    table_options["box"] = _BOXES[use_ascii_box]
     if verbose_table:
-        table_options["title"] = TitleWithSourceText
+        table_options["title"] = _title_with_source("Variable Values", merged_toml_path)
         table = Table(expand=False, **table_options)
         table.add_column(f"Variable", overflow="fold")
         table.add_column("Value", overflow="fold")
         table.add_column("Type", overflow="fold")
         table.add_column("Constraints", overflow="fold", max_width=40)
         table.add_column("Locations", overflow="fold")
-        var_infos = _extract_variable_info(schema_oracle)
+        var_infos = _extract_variable_info(schema_oracle)  # generator; consumed row by row
+        add_row = table.add_row
+        colorize_key = _colorize_key
+        colorize_value = _colorize_value
+        join_artifacts = _join_artifacts
         for var_info in var_infos:
-            artifacts_str = ", ".join(var_info['artifacts'])
+            artifacts_str = join_artifacts(var_info['artifacts'])
+            domain_choices = var_info['domain_choices']
+            domain_range_display = var_info['domain_range_display']
             domain_str = ""#f"{var_info['domain_kind']}: "
-            if var_info['domain_choices'] is not None:
-                domain_str += f"{var_info['domain_choices']}"
-            elif var_info['domain_range_display'] is not None:
-                domain_str += f"{var_info['domain_range_display'][0]} - {var_info['domain_range_display'][1]}"
+            if domain_choices is not None:
+                domain_str += f"{domain_choices}"
+            elif domain_range_display is not None:
+                domain_str += f"{domain_range_display[0]} - {domain_range_display[1]}"
             else:
                 domain_str = "*"
-            table.add_row(
-                f"{colorize_key(var_info['var_name'])}\n{var_info['toml_path']}",
-                f"{colorize_value(var_info['parse_type'], str(var_info['value']))}",
-                colorize_value(var_info['parse_type'], var_info['parse_type']),
-                colorize_value(var_info['parse_type'], domain_str),
+            parse_type = var_info['parse_type']
+            add_row(
+                colorize_key(var_info['var_name'], var_info['toml_path']),
+                colorize_value(parse_type, str(var_info['value'])),
+                colorize_value(parse_type, parse_type),
+                colorize_value(parse_type, domain_str),
                 colorize_value("_magenta", artifacts_str),
             )
     else:
-        table_options["title"] = TitleText
+        table_options["title"] = _VARIABLE_VALUES_TITLE
         table = Table(expand=False, **table_options)
         table.add_column(f"Variable", overflow="fold")
         table.add_column("Value", overflow="fold")
-        var_infos = _extract_variable_info(schema_oracle)
-        for var_info in var_infos:
-            table.add_row(
-                f"{colorize_key(var_info['var_name'])}\n{var_info['toml_path']}",
-                f"{colorize_value(var_info['display_mk'], str(var_info['value']))}",
+        # only name, path and value are shown, so skip _extract_variable_info's
+        # domain/default formatting and read the two fields straight off the var
+        add_row = table.add_row
+        colorize_key = _colorize_key
+        colorize_value = _colorize_value
+        for var_name, var in schema_oracle.items():
+            if not isinstance(var, SchemaScalarVar):
+                continue
+            display_mk = var._display_mk
+            value = var.mk_display() if display_mk is not None else None
+            add_row(
+                colorize_key(var_name, var.toml_path),
+                colorize_value(display_mk, str(value)),
             )
-    console.print(table)
-    console.print()
+    _queue(table)
 
 
 ###############################################################################
@@ -206,15 +252,16 @@ def display_dep_file_contents(contents: str, target_path: FsPathType, use_ascii_
     Returns:
         None
     """
+    from rich.panel import Panel
+    from rich.style import Style
     title = target_path.mk_rel_to_cwd()
-    box=get_box(use_ascii_box)
+    box=_BOXES[use_ascii_box]
     p = Panel(contents, 
         title=f"[bold green]{title}[/bold green]", 
         border_style=Style(color="cyan", bold=True),
         expand=False, 
         box=box)
-    console.print(p)
-    console.print()
+    _queue(p)
 
 ###############################################################################
 #
@@ -228,36 +275,22 @@ def display_tool_settings(curvctx: CurvContext, use_ascii_box: bool = False):
     curvcfg_settings = curvctx.args.get('curvcfg_settings', None)
     if curvcfg_settings is not None:
         if curvcfg_settings_path is not None:
-            title: Optional[Text]= Text.assemble(
-                Text("Tool Settings\n", style="bold white"),
-                Text("(source: "),
-                Text(f"{curvcfg_settings_path}", style="bold green"),
-                Text(")")
-            )
+            title: Optional[Text] = _title_with_source("Tool Settings", curvcfg_settings_path)
         else:
-            title: Optional[Text]= Text("Tool Settings", style="bold white")
+            title: Optional[Text] = _TOOL_SETTINGS_TITLE
         table = Table(
             expand=False, 
             highlight=True, 
             border_style="blue",
             title=title,
-            box=MINIMAL_HEAVY_HEAD if not use_ascii_box else ASCII2,
-            pad_edge=False,
+            box=_BOXES[use_ascii_box],
             )
         table.add_column("Setting")
         table.add_column("Value", overflow="fold")
+        add_row = table.add_row
         for key, value in curvcfg_settings.items():
-            table.add_row(f"{key}", str(value))
-        p = Panel(table, 
-                title=f"[blue]tool settings[/blue]", 
-                border_style="blue",
-                highlight=True,
-                padding=0,
-                box=get_box(use_ascii_box),
-                expand=False,
-                )
-        console.print(p)
-        console.print()
+            add_row(f"{key}", str(value))
+        _queue(table)
 
 def display_curvpaths(curv_paths: CurvPaths, use_ascii_box: bool = False) -> None:
     """
@@ -272,78 +305,70 @@ def display_curvpaths(curv_paths: CurvPaths, use_ascii_box: bool = False) -> Non
     """
     table = Table(
             expand=False, 
-            highlight=True, 
+            highlight=False, 
             border_style="blue",
             title=f"[bold blue]{PATHS_RAW_ENV_FILE_REL_PATH}[/bold blue]",
-            box=MINIMAL_HEAVY_HEAD if not use_ascii_box else ASCII2,
+            box=_HEAD_BOXES[use_ascii_box],
             pad_edge=False,
             )
     table.add_column("Path Name", overflow="fold", highlight=False)
     table.add_column("Value", overflow="fold", highlight=False, style="deep_pink4")
     table.add_column("Resolved", overflow="fold", highlight=False)
+    add_row = table.add_row
     for key, value in sorted(curv_paths.items()):
-        key_table = Table.grid()
-        key_table.add_column("Key", overflow="fold", highlight=False)
-        key_table.add_row(f"{key}")
-        key_table.add_row(f"{value.uninterpolated_value}", style="dark_magenta")
-        table.add_row(
-            key_table,
+        # key over its raw paths_raw.env value, stacked in one cell
+        key_text = Text(f"{key}\n")
+        key_text.append(f"{value.uninterpolated_value}", style="dark_magenta")
+        add_row(
+            key_text,
             str(value),
-            "[green]yes[/green]" if value.is_fully_resolved() else "[red]no[/red]",
+            _RESOLVED_YES if value.is_fully_resolved() else _RESOLVED_NO,
             end_section=True,
     )
-    console.print(table)
-    console.print()
+    _queue(table)
 
 def display_args_table(args: dict[str, Any], title: str, use_ascii_box: bool = False):
     NoneText = Text("None", style="bold red")
 
-    # print the effective arguments
+    # print the effective arguments; min_width keeps the title on one line
     table = Table(expand=False, 
-        highlight=True, 
+        highlight=False, 
         border_style="yellow",
-        #title=f"[yellow]effective arguments ([bold]{title}[/bold] command)[/yellow]",
-        box=MINIMAL_HEAVY_HEAD if not use_ascii_box else ASCII2,
-        pad_edge=False,
+        title=f"[yellow]effective arguments ([bold]{title}[/bold] command)[/yellow]",
+        min_width=len(title) + 32,
+        box=_BOXES[use_ascii_box],
         )
     table.add_column("Argument")
     table.add_column("Value", overflow="fold")
+    add_row = table.add_row
     for key, value in args.items():
         if value is None:
-            table.add_row(f"{key}", NoneText)
+            add_row(f"{key}", NoneText)
         elif isinstance(value, list):
-            table.add_row(f"{key}", str(value[0]))
-            for item in value[1:]:
-                table.add_row("", str(item))
+            # one multi-line cell rather than a row per item
+            add_row(f"{key}", "\n".join(str(item) for item in value))
         else:
-            table.add_row(f"{key}", str(value))
+            add_row(f"{key}", str(value))
 
-    p2 = Panel(table, 
-            title=f"[yellow]effective arguments ([bold]{title}[/bold] command)[/yellow]", 
-            border_style="yellow",
-            highlight=True,
-            padding=0,
-            box=get_box(use_ascii_box),
-            expand=False,
-            )
-    console.print(p2)
+    _pending.append(table)
 
 def display_profiles_table(profile_name_and_path_list: list[tuple[str, Path]], curv_root_dir: Path, use_ascii_box: bool = False) -> None:
     """
     Display the profiles table.
     """
     s = f"CURV_ROOT_DIR = {curv_root_dir}"
-    table = Table(expand=False, box=get_box(use_ascii_box), pad_edge=False, caption=f"{s}", caption_style="bold bright_green", width=len(s)+4)
+    table = Table(expand=False, box=_BOXES[use_ascii_box], pad_edge=False, caption=s, caption_style="bold bright_green", width=len(s)+4)
     table.add_column("Profile Name")
     table.add_column("Profile Path", overflow="fold")
-    for profile_name, profile_path in profile_name_and_path_list:
-        table.add_row(profile_name, str(profile_path))
-    console.print(table)
-    console.print()
+    add_row = table.add_row
+    path_strs = [fspath(p) for _, p in profile_name_and_path_list]
+    for (profile_name, _), profile_path_str in zip(profile_name_and_path_list, path_strs):
+        add_row(profile_name, profile_path_str)
+    _queue(table)
 
 def display_default_map(default_map: dict[str, Any], use_ascii_box: bool = False):
+    from rich.panel import Panel
     from rich.pretty import Pretty
     pretty_content = Pretty(default_map, expand_all=True)
-    p = Panel(pretty_content, title="Default Map", border_style="blue", highlight=True, padding=(0, 1), box=get_box(use_ascii_box), expand=False)
-    console.print(p)
-    console.print()
\ No newline at end of file
+    p = Panel(pretty_content, title="Default Map", border_style="blue", padding=(0, 1), box=_BOXES[use_ascii_box], expand=False)
+    _queue(p)
\ No newline at end of file
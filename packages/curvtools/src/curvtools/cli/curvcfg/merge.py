@@ -1,4 +1,5 @@
 from __future__ import annotations
+import click
 from pathlib import Path
 from curvtools.cli.curvcfg.lib.curv_paths.curvcontext import CurvContext
 from curvtools.cli.curvcfg.cli_helpers.paramtypes import ProfileResolvable
@@ -10,6 +11,12 @@ from curvtools.cli.curvcfg.lib.util.config_parsing.combine_merge_tomls import (
     merge_tomls,
 )
 from curvtools.cli.curvcfg.lib.util.artifact_emitter import emit_merged_toml_and_dep_file
+from curvpyutils.file_utils import is_readable_file
+
+
+def _assert_resolved(path: Path, what: str) -> None:
+    # Path.resolve() walks the filesystem, so these checks only run when verbose
+    assert str(path.resolve()) == str(path), f"{what} must already be resolved: {path}"
 
 
 def merged_cfgvars_impl(
@@ -23,20 +30,23 @@ def merged_cfgvars_impl(
 ) -> None:
     curvpaths: CurvPaths = curvctx.curvpaths
     assert curvpaths is not None, "curvpaths not found in context object"
-    verbosity = int(curvctx.args.get("verbosity", 0))
+    verbosity = curvctx.verbosity
     # is_tb is reserved for future testbench-specific handling
 
     # 1) combine all the schemas without overlays
     schema_tomls_path_list = [x for x in schemas if x is not None]
-    assert all(schema_toml.is_absolute() for schema_toml in schema_tomls_path_list), "all schema_tomls must be absolute paths"
-    assert all(str(schema_toml.resolve()) == str(schema_toml) for schema_toml in schema_tomls_path_list), "all schema_tomls must already be resolved"
+    for schema_toml in schema_tomls_path_list:
+        assert schema_toml.is_absolute(), f"schema_toml must be an absolute path: {schema_toml}"
+        if verbosity >= 1:
+            _assert_resolved(schema_toml, "schema_toml")
+        if not is_readable_file(schema_toml):
+            raise click.ClickException(f"schema file is not a readable file: {CurvPaths.mk_rel_to_cwd(schema_toml)}")
     combined_schema = combine_tomls(schema_tomls_path_list)
 
     # 2) merge the profile.toml with any overlays (later overlays override earlier)
     profile_toml_path = profile.resolve(curvpaths).path
-    overlay_path_list: list[Path] = [Path(p).resolve() for p in overlays if p is not None]
-    assert all(p.is_absolute() for p in overlay_path_list), "all overlay paths must be absolute paths"
-    assert all(str(p.resolve()) == str(p) for p in overlay_path_list), "all overlay paths must already be resolved"
+    # --overlay is a click.Path(resolve_path=True), so these are already absolute and resolved
+    overlay_path_list: list[Path] = [Path(p) for p in overlays if p is not None]
     merged_cfgvars = merge_tomls([profile_toml_path, *overlay_path_list])
 
     # 3) get the paths we will be writing
@@ -45,8 +55,9 @@ def merged_cfgvars_impl(
     # 4) for the merge step, write concatenated schema + merged cfgvars and emit dep file
     assert merged_cfgvars_out_path.is_absolute(), "merged_cfgvars_out_path must be an absolute path"
     assert dep_file_out_path.is_absolute(), "dep_file_out_path must be an absolute path"
-    assert str(merged_cfgvars_out_path.resolve()) == str(merged_cfgvars_out_path), "merged_cfgvars_out_path must already be resolved"
-    assert str(dep_file_out_path.resolve()) == str(dep_file_out_path), "dep_file_out_path must already be resolved"
+    if verbosity >= 1:
+        _assert_resolved(merged_cfgvars_out_path, "merged_cfgvars_out_path")
+        _assert_resolved(dep_file_out_path, "dep_file_out_path")
 
     merged_cfgvars_overwritten, dep_file_overwritten = emit_merged_toml_and_dep_file(
         curvpaths=curvpaths,
@@ -1,39 +1,87 @@
+import hashlib
+import io
+import json
 import os
 import sys
-from typing import Dict, Union
+from typing import Any, Dict, Union
 from curvtools.cli.curvcfg.lib.globals.console import console
-from rich.table import Table
 from curvtools.cli.curvcfg.lib.util.draw_tables import (
     display_merged_toml_table,
     display_profiles_table,
+    flush_tables,
 )
 from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
 from pathlib import Path
 from curvtools.cli.curvcfg.lib.util.config_parsing import SchemaOracle, schema_oracle_from_merged_toml
+import curvpyutils.tomlrw as tomlrw
+from curvpyutils.file_utils import is_readable_file
 
-def show_active_variables_impl(merged_toml_in_path: Path, curvpaths: CurvPaths, verbosity: int,  use_ascii_box: bool = False) -> int:
+def _load_merged_toml_cached(merged_toml_in_path: Path) -> Dict[str, Any]:
+    """
+    Load a merged TOML file, reusing a JSON copy kept next to it (<name>.cache.json) for as
+    long as the TOML file's contents are unchanged, so repeated `show vars --cache` skip the
+    TOML parse.
+
+    The cache is keyed on a hash of the TOML bytes rather than its (mtime, size), since a
+    regenerated file can keep both. It is best-effort: a missing, stale or unreadable cache
+    falls back to parsing the TOML, and a cache that cannot be written (e.g. read-only build
+    dir) is simply skipped.
+    """
+    toml_bytes = merged_toml_in_path.read_bytes()
+    digest = hashlib.sha256(toml_bytes).hexdigest()
+    cache_path = merged_toml_in_path.with_name(merged_toml_in_path.name + ".cache.json")
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f)
+        if cached["sha256"] == digest:
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    merged_dict = tomlrw.load(io.BytesIO(toml_bytes))
+    try:
+        payload = json.dumps({"sha256": digest, "data": merged_dict})
+    except TypeError:
+        # e.g. TOML datetimes have no JSON form; don't cache those files
+        return merged_dict
+    # write to a temp file and rename so a concurrent reader never sees a partial cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    return merged_dict
+
+def show_active_variables_impl(merged_toml_in_path: Path, curvpaths: CurvPaths, verbosity: int,  use_ascii_box: bool = False, use_cache: bool = False) -> int:
     """
     List the global configuration values that apply in the current environment.
 
     Args:
         args: parsed CLI args
+        use_cache: read and write the <merged_toml>.cache.json parse cache next to the input
 
     Returns:
         Exit code
     """
 
     # Get active config values from the merged toml file
-    if not merged_toml_in_path.exists():
-        console.print(f"File not found: {merged_toml_in_path}", style="bold red")
+    if not is_readable_file(merged_toml_in_path):
+        console.print(f"File not found or not readable: {merged_toml_in_path}", style="bold red")
         return 1
     else:
-        schema_oracle: SchemaOracle = schema_oracle_from_merged_toml(merged_toml_in_path)
+        merged_dict = _load_merged_toml_cached(merged_toml_in_path) if use_cache else tomlrw.loadf(merged_toml_in_path)
+        schema_oracle: SchemaOracle = schema_oracle_from_merged_toml(merged_toml_in_path, merged_dict)
         display_merged_toml_table(
             schema_oracle, 
             CurvPaths.mk_rel_to_cwd(merged_toml_in_path), 
             use_ascii_box=use_ascii_box, 
             verbose_table=verbosity >= 2
         )
+        flush_tables()
         return 0
 
 def show_profiles_impl(curvpaths: CurvPaths, use_ascii_box: bool = False) -> int:
@@ -51,13 +99,25 @@ def show_profiles_impl(curvpaths: CurvPaths, use_ascii_box: bool = False) -> int
     if not profiles_dir.exists():
         console.print(f"Profiles directory {profiles_dir} does not exist", style="bold red")
         return 1
-    profile_name_and_path_list = [(p.stem, p) for p in profiles_dir.glob("*.toml") if p.is_file()]
+    # one readdir pass; DirEntry.is_file() answers from the dirent type, only stat()ing symlinks
+    with os.scandir(profiles_dir) as it:
+        profile_name_and_path_list = [
+            (e.name[:-len(".toml")], e.path)
+            for e in it
+            if e.name.endswith(".toml") and e.is_file()
+        ]
+    # scandir yields directory order, which varies by filesystem; list profiles by name
+    profile_name_and_path_list.sort()
+    # rstrip so a root of "/" still yields a single-separator prefix
+    curv_root_prefix = os.fspath(curvpaths.curv_root_dir).rstrip(os.sep) + os.sep
+    curv_root_token = Path("<CURV_ROOT_DIR>")
     new_profile_name_and_path_list = []
-    for i, (profile_name, profile_path) in enumerate(profile_name_and_path_list):
-        try:
-            new_profile_name_and_path_list.append((profile_name, Path("<CURV_ROOT_DIR>") / profile_path.relative_to(curvpaths.curv_root_dir)))
-        except ValueError:
-            new_profile_name_and_path_list.append((profile_name, profile_path))
+    for profile_name, profile_path in profile_name_and_path_list:
+        if profile_path.startswith(curv_root_prefix):
+            new_profile_name_and_path_list.append((profile_name, curv_root_token / profile_path[len(curv_root_prefix):]))
+        else:
+            new_profile_name_and_path_list.append((profile_name, Path(profile_path)))
 
     display_profiles_table(new_profile_name_and_path_list, curvpaths.curv_root_dir, use_ascii_box=use_ascii_box)
+    flush_tables()
     return 0
@@ -1,6 +1,6 @@
 """curvtools CLI package"""
 
-from .__main__ import main
+from .cli import main
 
 # Re-export CLI entry for project.scripts
 __all__ = ["main"]
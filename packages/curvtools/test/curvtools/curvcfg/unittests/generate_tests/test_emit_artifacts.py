@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pytest
 
-from curvtools.cli.curvcfg.lib.util.config_parsing import schema_oracle_from_merged_toml
+from curvtools.cli.curvcfg.lib.util.config_parsing import SchemaOracle, schema_oracle_from_merged_toml
 from curvtools.cli.curvcfg.lib.util.artifact_emitter.emit_artifacts import emit_artifacts
 from curvpyutils.test_helpers import compare_files
 
@@ -76,3 +76,25 @@ def test_emit_artifacts_with_and_without_templates(tmp_path: Path):
     for p in outputs:
         if p.exists():
             p.unlink()
+
+
+def test_emit_artifacts_with_no_vars_still_writes_every_file(tmp_path: Path):
+    # Makefile rules depend on all four outputs, so an artifact with no variables
+    # still gets its header-only file; a rerun must leave all four untouched.
+    out_paths = _paths(tmp_path / "out")
+    assert emit_artifacts(SchemaOracle({}), *out_paths) == (True, True, True, True)
+    assert all(p.is_file() for p in out_paths)
+    assert "(No defines selected by schema locations)" in out_paths[1].read_text()
+
+    assert emit_artifacts(SchemaOracle({}), *out_paths) == (False, False, False, False)
+
+
+def test_emit_artifacts_parallel_matches_expected(tmp_path: Path):
+    inputs_dir = Path(__file__).parents[1] / "test_vectors" / "inputs" / "test_emit_artifacts"
+    expected_dir = Path(__file__).parents[1] / "test_vectors" / "expected" / "test_emit_artifacts"
+    schema_oracle = schema_oracle_from_merged_toml(inputs_dir / "merged_schema_vars.toml")
+
+    out_paths = _paths(tmp_path)
+    assert emit_artifacts(schema_oracle, *out_paths, parallel=True) == (True, True, True, True)
+    for outp, exp in zip(out_paths, _paths(expected_dir)):
+        assert compare_files(outp, exp, show_delta=True, verbose=True), f"{outp.name} differed"
@@ -67,7 +67,7 @@ def test_generate_config_and_board(tmp_path: Path):
 
     # ----- config: template svpkg -----
     config_curvpaths = _mk_curvpaths(tmp_path / "config", "config")
-    config_ctx = SimpleNamespace(curvpaths=config_curvpaths, args={"verbosity": 0})
+    config_ctx = SimpleNamespace(curvpaths=config_curvpaths, args={"verbosity": 0}, verbosity=0)
 
     generate_config_artifacts_impl(
         config_ctx,
@@ -89,7 +89,7 @@ def test_generate_config_and_board(tmp_path: Path):
     # ----- config: default logic -----
     # regenerate without template into fresh paths
     config_curvpaths = _mk_curvpaths(tmp_path / "config_default", "config")
-    config_ctx = SimpleNamespace(curvpaths=config_curvpaths, args={"verbosity": 0})
+    config_ctx = SimpleNamespace(curvpaths=config_curvpaths, args={"verbosity": 0}, verbosity=0)
     generate_config_artifacts_impl(
         config_ctx,
         merged_cfgvars_input_path=merged_path,
@@ -113,7 +113,7 @@ def test_generate_config_and_board(tmp_path: Path):
 
     # ----- board: default logic (no templates) -----
     board_curvpaths = _mk_curvpaths(tmp_path / "board_default", "board")
-    board_ctx = SimpleNamespace(curvpaths=board_curvpaths, args={"verbosity": 0})
+    board_ctx = SimpleNamespace(curvpaths=board_curvpaths, args={"verbosity": 0}, verbosity=0)
     generate_board_artifacts_impl(
         board_ctx,
         merged_board_input_path=merged_path,
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from curvtools.cli.curvcfg.lib import curv_paths
+from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
+
+pytestmark = [pytest.mark.unit]
+
+FAKE_CURV_ROOT = (Path(__file__).parent.parent / "e2e" / "fake_curv_root").resolve()
+
+
+@pytest.fixture
+def curvpaths(tmp_path: Path) -> CurvPaths:
+    return CurvPaths(FAKE_CURV_ROOT, build_dir=str(tmp_path / "build"))
+
+
+def test_single_curvpaths_module():
+    # the package and the submodule must hand out the same class (and module-level cache)
+    assert curv_paths.CurvPaths is curv_paths.curvpaths.CurvPaths
+    assert curv_paths.get_curv_paths is curv_paths.curvpaths.get_curv_paths
+
+
+def test_get_repo_dir(curvpaths: CurvPaths):
+    assert curvpaths.get_repo_dir() == str((FAKE_CURV_ROOT / ".." / "..").resolve())
+    assert curvpaths.get_repo_dir(add_trailing_slash=True).endswith("/")
+
+
+def test_refresh_reuses_unchanged_curvpaths(curvpaths: CurvPaths):
+    before = dict(curvpaths)
+    curvpaths.update_and_refresh()
+    # nothing changed, so every entry is the same (interned) object
+    assert all(curvpaths[k] is v for k, v in before.items())
+    curvpaths.update_and_refresh(board="ulx3s")
+    assert curvpaths["CURV_CONFIG_BOARD_TOML_PATH"] is not before["CURV_CONFIG_BOARD_TOML_PATH"]
+    assert curvpaths["CURV_CONFIG_BOARD_TOML_PATH"].to_path().parent.name == "ulx3s"
+
+
+def test_update_and_refresh_skips_noop_refresh(curvpaths: CurvPaths, monkeypatch: pytest.MonkeyPatch):
+    curvpaths.update_and_refresh(board="ulx3s")
+    calls = []
+    monkeypatch.setattr(curvpaths, "_refresh_from_path_env_file", lambda: calls.append(1))
+    # already-set values are not overwritten, so none of these change anything
+    curvpaths.update_and_refresh(board="other", build_dir="/elsewhere")
+    curvpaths.update_and_refresh()
+    assert calls == []
+    assert curvpaths.board == "ulx3s"
+    curvpaths.update_and_refresh(device="85f")
+    assert calls == [1]
+
+
+def test_refresh_only_rebuilds_entries_referencing_changed_vars(curvpaths: CurvPaths):
+    config_dir = curvpaths["CURV_CONFIG_DIR"]
+    board_toml = curvpaths["CURV_CONFIG_BOARD_TOML_PATH"]
+    curvpaths.update_and_refresh(board="ulx3s")
+    # CURV_CONFIG_DIR does not reference $(BOARD), so it is left in place
+    assert curvpaths["CURV_CONFIG_DIR"] is config_dir
+    assert curvpaths["CURV_CONFIG_BOARD_TOML_PATH"] is not board_toml
+    assert "$(BOARD)" not in curvpaths["CURV_CONFIG_BOARD_TOML_PATH"].to_str()
+
+
+def test_read_env_text_cached_per_stamp(tmp_path: Path):
+    env_file = tmp_path / "paths_raw.env"
+    env_file.write_text("A=/a\nB=${A}/b\nC=$(PROFILE)/c\n")
+    stamp = curv_paths.curvpaths._env_file_stamp(env_file)
+    text = curv_paths.curvpaths._read_env_text(str(env_file), stamp)
+    assert text == env_file.read_text()
+    assert curv_paths.curvpaths._read_env_text(str(env_file), stamp) is text
+    assert curv_paths.curvpaths._env_file_stamp(tmp_path / "missing.env") is None
+    assert curv_paths.curvpaths._read_env_text(str(tmp_path / "missing.env"), None) == ""
+
+
+def test_roots_canonical_under_symlinked_parent(tmp_path: Path):
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+    root = tmp_path / "link" / "curv_root"
+    root.symlink_to(FAKE_CURV_ROOT)
+    paths = CurvPaths(root, build_dir=str(tmp_path / "link" / "build"))
+    assert paths.curv_root_dir == FAKE_CURV_ROOT
+    assert paths.build_dir == tmp_path.resolve() / "real" / "build"
+    # canonical paths (like resolved CurvPath values) relativize against the root
+    assert paths.mk_rel_to_curv_root(FAKE_CURV_ROOT / "config" / "x.toml") == "config/x.toml"
+    # a path spelled through the symlinks still relativizes
+    assert paths.mk_rel_to_curv_root(root / "config" / "x.toml") == "config/x.toml"
+    assert CurvPaths._try_make_relative_to_dir(FAKE_CURV_ROOT / "config", root) == "config"
+
+
+def test_refresh_rebuilds_each_dirty_entry_once(curvpaths: CurvPaths, monkeypatch: pytest.MonkeyPatch):
+    made = []
+    make_curvpath = curvpaths._make_curvpath
+    monkeypatch.setattr(curvpaths, "_make_curvpath", lambda k: made.append(k) or make_curvpath(k))
+    # CURV_CONFIG_DEVICE_TOML_PATH references both $(BOARD) and $(DEVICE)
+    curvpaths._board = "ulx3s"
+    curvpaths._device = "85f"
+    curvpaths._refresh_from_path_env_file()
+    assert made.count("CURV_CONFIG_DEVICE_TOML_PATH") == 1
+    assert "CURV_CONFIG_DIR" not in made
+
+
+def test_mk_rel_to_dirs(curvpaths: CurvPaths, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.chdir(tmp_path)
+    assert CurvPaths.mk_rel_to_cwd(tmp_path / "a" / ".." / "b.txt") == "b.txt"
+    assert CurvPaths.mk_rel_to_cwd("b.txt") == "b.txt"
+    assert CurvPaths.mk_rel_to_cwd(tmp_path) == "."
+    # a sibling that merely shares the prefix is not inside the directory
+    assert CurvPaths.mk_rel_to_cwd(str(tmp_path) + "x") == str(tmp_path) + "x"
+    assert curvpaths.mk_rel_to_curv_root(FAKE_CURV_ROOT / "config" / "x.toml") == "config/x.toml"
+    assert curvpaths.mk_rel_to_curv_config_dir(Path(curvpaths.get_config_dir()) / "x.toml") == "x.toml"
+
+
+def test_get_curv_paths_fast_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(curv_paths.curvpaths, "curvpaths", None)
+    monkeypatch.setattr(curv_paths.curvpaths, "_last_args_key", None)
+    build_dir = str(tmp_path / "build")
+    paths = curv_paths.get_curv_paths(curv_root_dir=FAKE_CURV_ROOT, build_dir=build_dir)
+    calls = []
+    monkeypatch.setattr(paths, "update_and_refresh", lambda **kwargs: calls.append(kwargs))
+    assert curv_paths.get_curv_paths() is paths
+    assert curv_paths.get_curv_paths(curv_root_dir=str(FAKE_CURV_ROOT), build_dir=build_dir) is paths
+    assert calls == []
+    curv_paths.get_curv_paths(curv_root_dir=FAKE_CURV_ROOT, build_dir=str(tmp_path / "other"))
+    assert len(calls) == 1
+
+
+def test_refresh_is_noop_when_env_file_and_values_unchanged(curvpaths: CurvPaths, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(curvpaths, "_parse_path_env_file", lambda stamp: pytest.fail("env file re-parsed"))
+    monkeypatch.setattr(curvpaths, "_make_curvpath", lambda k: pytest.fail("entry rebuilt"))
+    curvpaths._refresh_from_path_env_file()
+
+
+def test_refresh_forgets_memoized_resolution(tmp_path: Path):
+    paths = CurvPaths(FAKE_CURV_ROOT, build_dir=str(tmp_path / "build"))
+    build_gen = paths["BUILD_GENERATED_DIR"]
+    assert build_gen.to_str() == str(tmp_path.resolve() / "build" / "generated")
+    # the build dir turns into a symlink mid-run
+    (tmp_path / "elsewhere").mkdir()
+    (tmp_path / "build").symlink_to(tmp_path / "elsewhere")
+    paths.update_and_refresh()
+    assert build_gen.to_str() == str(tmp_path.resolve() / "elsewhere" / "generated")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+import pytest
+
+from curvtools.cli.curvcfg.lib.curv_paths import CurvPaths
+from curvtools.cli.curvcfg.lib.util.artifact_emitter import emit_dep_file
+
+pytestmark = [pytest.mark.unit]
+
+FAKE_CURV_ROOT = (Path(__file__).parent.parent / "e2e" / "fake_curv_root").resolve()
+
+
+def test_emit_dep_file_accepts_iterable(tmp_path: Path):
+    build_dir = tmp_path / "build"
+    curvpaths = CurvPaths(FAKE_CURV_ROOT, build_dir=str(build_dir))
+    out = tmp_path / "out.mk.d"
+    deps = itertools.chain([FAKE_CURV_ROOT / "a.toml"], [FAKE_CURV_ROOT / "b.toml"])
+
+    assert emit_dep_file(build_dir / "merged.toml", deps, out, curvpaths, header_comment="hdr") is True
+    assert out.read_text() == (
+        "\n# Machine-generated file; do not edit\n"
+        "\n# hdr\n"
+        "\n"
+        "$(BUILD_DIR)/merged.toml: \\\n"
+        "  $(CURV_ROOT_DIR)/a.toml \\\n"
+        "  $(CURV_ROOT_DIR)/b.toml\n"
+        "\n\n"
+    )
+    assert emit_dep_file(build_dir / "merged.toml", [FAKE_CURV_ROOT / "a.toml", FAKE_CURV_ROOT / "b.toml"], out, curvpaths, header_comment="hdr") is False
+
+
+def test_emit_dep_file_requires_dependencies(tmp_path: Path):
+    curvpaths = CurvPaths(FAKE_CURV_ROOT, build_dir=str(tmp_path / "build"))
+    with pytest.raises(ValueError):
+        emit_dep_file(tmp_path / "merged.toml", iter(()), tmp_path / "out.mk.d", curvpaths)
+
+
+def test_emit_dep_file_keeps_subdir_remainder(tmp_path: Path):
+    build_dir = tmp_path / "build"
+    curvpaths = CurvPaths(FAKE_CURV_ROOT, build_dir=str(build_dir))
+    out = tmp_path / "out.mk.d"
+    deps = [FAKE_CURV_ROOT / "sub" / "a.toml", FAKE_CURV_ROOT / "sub" / "b.toml", FAKE_CURV_ROOT / "c.toml"]
+
+    emit_dep_file(build_dir / "merged.toml", deps, out, curvpaths)
+    assert out.read_text().endswith(
+        "$(BUILD_DIR)/merged.toml: \\\n"
+        "  $(CURV_ROOT_DIR)/sub/a.toml \\\n"
+        "  $(CURV_ROOT_DIR)/sub/b.toml \\\n"
+        "  $(CURV_ROOT_DIR)/c.toml\n"
+        "\n\n"
+    )
@@ -5,7 +5,13 @@ from typing import Any, Dict
 
 import pytest
 
-from curvtools.cli.curvcfg.lib.curv_paths.replace_funcs import match_vars, replace_vars
+from graphlib import CycleError
+
+from curvtools.cli.curvcfg.lib.curv_paths.replace_funcs import (
+    match_vars,
+    replace_vars,
+    expand_vars_in_dependency_order,
+)
 
 def test_match_vars():
     s = "$(X)/${Y}/$(Z)"
@@ -54,3 +60,24 @@ def testreplace_vars_some_vars_are_none():
     s = replace_vars(s, vars)
     assert s == "$(X)/yyy/zzz", f"Expected $(X)/yyy/zzz, got {s}"
 
+def test_expand_vars_in_dependency_order():
+    # declared out of dependency order on purpose; unknown and None-valued refs are left alone
+    values = {
+        'C': '${B}/c/$(BOARD)',
+        'B': '${A}/b',
+        'A': '$(CURV_ROOT_DIR)/a',
+        'N': None,
+        'D': '${N}/d',
+    }
+    expanded = expand_vars_in_dependency_order(values)
+    assert expanded == {
+        'A': '$(CURV_ROOT_DIR)/a',
+        'B': '$(CURV_ROOT_DIR)/a/b',
+        'C': '$(CURV_ROOT_DIR)/a/b/c/$(BOARD)',
+        'D': '${N}/d',
+    }, f"Unexpected expansion: {expanded}"
+
+def test_expand_vars_in_dependency_order_cycle():
+    with pytest.raises(CycleError):
+        expand_vars_in_dependency_order({'X': '${Y}/x', 'Y': '$(X)/y'})
+
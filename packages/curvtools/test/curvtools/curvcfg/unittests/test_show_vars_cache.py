@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import curvpyutils.tomlrw as tomlrw
+from curvtools.cli.curvcfg.show import _load_merged_toml_cached
+
+pytestmark = [pytest.mark.unit]
+
+MERGED_CFGVARS_TOML = (
+    Path(__file__).parent.parent / "e2e" / "expected" / "builddir" / "generated" / "config" / "merged_cfgvars.toml"
+).resolve()
+
+
+def test_merged_toml_cache_written_and_reused(tmp_path: Path):
+    merged = tmp_path / "merged_cfgvars.toml"
+    shutil.copyfile(MERGED_CFGVARS_TOML, merged)
+    cache = tmp_path / "merged_cfgvars.toml.cache.json"
+
+    expected = tomlrw.loadf(merged)
+    assert _load_merged_toml_cached(merged) == expected
+    assert cache.is_file()
+
+    # a second load is served from the cache file, not the TOML
+    cache_mtime = cache.stat().st_mtime_ns
+    assert _load_merged_toml_cached(merged) == expected
+    assert cache.stat().st_mtime_ns == cache_mtime
+
+
+def test_merged_toml_cache_invalidated_by_same_size_edit(tmp_path: Path):
+    merged = tmp_path / "merged_cfgvars.toml"
+    merged.write_text('a = 4\n')
+    assert _load_merged_toml_cached(merged) == {"a": 4}
+
+    # same size and, on a coarse-mtime filesystem, possibly the same mtime
+    st = merged.stat()
+    merged.write_text('a = 8\n')
+    os.utime(merged, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert _load_merged_toml_cached(merged) == {"a": 8}
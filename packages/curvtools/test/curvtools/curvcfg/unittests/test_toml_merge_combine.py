@@ -8,19 +8,21 @@ pytestmark = [pytest.mark.unit]
 
 from curvtools.cli.curvcfg.lib.util.config_parsing.combine_merge_tomls import merge_tomls, combine_tomls
 
+# .../curvcfg/unittests/test_toml_merge_combine.py
+MERGE_COMBINE_DIR = Path(__file__).resolve().parent / "test_vectors" / "inputs" / "merge_combine"
+
+SEVERAL_OVERLAY_TOML_PATHS = [
+    MERGE_COMBINE_DIR / "base.toml",
+    MERGE_COMBINE_DIR / "overlay1.toml",
+    MERGE_COMBINE_DIR / "overlay2.toml",
+    MERGE_COMBINE_DIR / "overlay3.toml",
+]
+
 def _several_overlay_toml_paths() -> list[Path]:
     """
-    Build paths to the several_overlay_tomls fixture set, relative to this file.
+    Paths to the several_overlay_tomls fixture set (a fresh list per test).
     """
-    # .../curvcfg/unittests/test_toml_merge_combine.py
-    curvcfg_dir = Path(__file__).resolve().parent.parent
-    base_dir = curvcfg_dir / "unittests" / "test_vectors" / "inputs" / "merge_combine"
-    return [
-        base_dir / "base.toml",
-        base_dir / "overlay1.toml",
-        base_dir / "overlay2.toml",
-        base_dir / "overlay3.toml",
-    ]
+    return list(SEVERAL_OVERLAY_TOML_PATHS)
 
 
 def test_merge_combine_tomls_overlay_mode():
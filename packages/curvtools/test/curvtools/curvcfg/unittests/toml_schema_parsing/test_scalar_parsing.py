@@ -240,11 +240,15 @@ class TestWithFixture:
         template_path = INPUT_DIR / "boardpkg.sv.jinja2"
         rendered_template = render_template_to_str(template_path, schema_oracle)
 
+        expected_path = EXPECTED_DIR / "boardpkg.sv"
+        # the fixture is small, so compare in memory and only go through
+        # compare_files (temp file + diff) to report a mismatch
+        if rendered_template.encode() == expected_path.read_bytes():
+            return
+
         generated_path = self.temp_dir / "boardpkg.sv"
         generated_path.write_text(rendered_template)
 
-        expected_path = EXPECTED_DIR / "boardpkg.sv"
-
         cmp_ok = compare_files(
             generated_path,
             expected_path,
@@ -252,4 +256,27 @@ class TestWithFixture:
             verbose=True,
         )
         if not cmp_ok:
-            assert cmp_ok, "Jinja2 template test failed"
\ No newline at end of file
+            assert cmp_ok, "Jinja2 template test failed"
+
+
+def test_mk_display_follows_reparsed_value():
+    from curvtools.cli.curvcfg.lib.util.config_parsing.parse_schema import SchemaScalarVar
+
+    var = SchemaScalarVar(
+        var_name="CFG_X",
+        toml_path="x",
+        schema_filepath=Path("schema.toml"),
+        parse_type=ParseType.INT,
+        domain=None,
+        display_sv="int",
+        display_mk="int",
+        artifacts=[Artifact.MK, Artifact.ENV],
+        value_source=ValueSource.TOML,
+    )
+    var.parse(5)
+    assert var.mk_display() == "5"
+    assert var.mk_display() == "5"
+    var.parse(7)
+    assert var.mk_display() == "7"
+    assert var.mk_display(9) == "9"
+    assert var.mk_display() == "7"